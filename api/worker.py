@@ -131,7 +131,11 @@ async def regenerate_images_task(
         context.final_report = json.load(f)
 
     image_generator = get_image_generator()
-    context = await image_generator.process(context, temperature_override=temperature)
+    # The prompts are copied unchanged, so the image cache would otherwise hand
+    # back the original images instead of new ones.
+    context = await image_generator.process(
+        context, temperature_override=temperature, force_regenerate=True
+    )
 
     original_timestamp = Path(original_results_path.name).name.split("_")[0]
     original_slug = "_".join(Path(original_results_path.name).name.split("_")[1:])
@@ -6,6 +6,7 @@ ARQ uses this class to configure the Redis connection, discover tasks,
 and set worker behavior.
 """
 
+import asyncio
 import os
 from arq.connections import RedisSettings
 from dotenv import load_dotenv
@@ -17,6 +18,12 @@ load_dotenv()
 
 # --- START: IMPORT NEW TASK ---
 from .worker import create_creative_report, regenerate_images_task
+from catalyst import settings
+from catalyst.clients import gemini
+from catalyst.pipeline.processors.generation import (
+    close_openai_client,
+    prewarm_openai_client,
+)
 
 # --- END: IMPORT NEW TASK ---
 
@@ -39,11 +46,19 @@ async def on_startup(ctx):
             ],
         )
         print("✅ Sentry configured for ARQ worker.")
+    # Establish the Gemini and OpenAI connection pools before the first job arrives.
+    # Pre-warming is best-effort, so a hung upstream never holds up startup.
+    for prewarm in (gemini.prewarm_async, prewarm_openai_client):
+        try:
+            await asyncio.wait_for(prewarm(), timeout=settings.PREWARM_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            print(f"⚠️ {prewarm.__name__} timed out. Continuing startup without it.")
     print("ARQ worker started. Ready to process creative jobs.")
 
 
 async def on_shutdown(ctx):
     """A function that runs when the ARQ worker shuts down."""
+    await close_openai_client()
     print("ARQ worker shutting down.")
 
 
@@ -27,6 +27,21 @@ logger = get_logger(__name__)
 # --- Public-Facing Functions ---
 
 
+async def prewarm_async() -> None:
+    """
+    Opens the shared client's connection pool ahead of the first real request
+    with a cheap model-metadata lookup, so the TCP/TLS handshake is not paid
+    on the critical path of the first pipeline step.
+    """
+    if not client:
+        return
+    try:
+        await client.aio.models.get(model=settings.GEMINI_MODEL_NAME)
+        logger.info("🔥 Gemini client connection pre-warmed.")
+    except Exception as e:
+        logger.warning("⚠️ Could not pre-warm the Gemini client: %s", e)
+
+
 async def generate_content_async(
     prompt_parts: List[Any],
     response_schema: Optional[Union[type[BaseModel], Dict[str, Any]]] = None,
@@ -6,9 +6,16 @@ delays) for the Gemini API client.
 """
 
 import random
+from typing import Optional
+
 from google.api_core import exceptions as google_exceptions
+from google.genai import errors as genai_errors
+
 from ... import settings
 
+# The longest any single retry wait may last, whether computed or server-sent.
+MAX_RETRY_DELAY_SECONDS = 60
+
 
 def should_retry(e: Exception) -> bool:
     """
@@ -31,6 +38,10 @@ def should_retry(e: Exception) -> bool:
     ):
         return True
 
+    # The google-genai SDK raises its own APIError types carrying the HTTP code.
+    if isinstance(e, genai_errors.APIError) and (e.code == 429 or e.code >= 500):
+        return True
+
     # As a fallback, check for a common "service unavailable" string.
     if "service unavailable" in str(e).lower():
         return True
@@ -59,5 +70,46 @@ def calculate_backoff_delay(attempt: int) -> float:
     delay = exponential_delay + jitter
 
     # Cap the delay at a reasonable maximum to prevent excessively long waits.
-    return min(delay, 60)
+    return min(delay, MAX_RETRY_DELAY_SECONDS)
     # --- END: THE DEFINITIVE, CONFIGURABLE REFACTOR ---
+
+
+def calculate_full_jitter_delay(attempt: int) -> float:
+    """
+    Calculates exponential backoff with "full jitter": a uniform delay between
+    zero and the capped exponential delay.
+
+    Additive jitter keeps concurrent callers clustered around the same retry
+    time; drawing across the whole window spreads a burst of parallel
+    failures out so they do not hit the quota together again.
+    """
+    ceiling = min(
+        settings.RETRY_BACKOFF_BASE_DELAY * (2**attempt), MAX_RETRY_DELAY_SECONDS
+    )
+    return random.uniform(0, ceiling)
+
+
+def get_retry_after_delay(e: Exception) -> Optional[float]:
+    """
+    Returns the cooldown (in seconds) the server asked for on a rate-limited
+    error, or None if it did not specify one. Checks the HTTP `Retry-After`
+    header first, then the `RetryInfo` detail that Gemini puts in the error body.
+    """
+    headers = getattr(getattr(e, "response", None), "headers", None)
+    if headers:
+        try:
+            return float(headers.get("retry-after"))
+        except (TypeError, ValueError):
+            pass
+
+    # google.genai errors carry the parsed JSON error body as `details`.
+    details = getattr(e, "details", None)
+    if isinstance(details, dict):
+        for detail in details.get("error", {}).get("details") or []:
+            retry_delay = detail.get("retryDelay")  # e.g. "30s"
+            if isinstance(retry_delay, str) and retry_delay.endswith("s"):
+                try:
+                    return float(retry_delay[:-1])
+                except ValueError:
+                    pass
+    return None
@@ -8,7 +8,9 @@ and artifacts of a single execution pipeline.
 import json
 import uuid
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+
+from .models.trend_report import FashionTrendReport
 
 
 class RunContext:
@@ -44,6 +46,15 @@ class RunContext:
         self.antagonist_synthesis: str = ""
         self.structured_research_context: Dict[str, Any] = {}
         self.final_report: Dict = {}
+        # The model behind final_report as validated by the final quality gate,
+        # kept so later steps can use it without validating the dict again.
+        self.validated_report: Optional[FashionTrendReport] = None
+        # Parsed image prompts, cached so every generator run in this pipeline
+        # reuses them instead of re-reading the prompts file.
+        self.prompts_data: Optional[Dict[str, Dict[str, str]]] = None
+        # (garment_name, prompt_type) pairs whose image could not be generated,
+        # so a caller can retry just those instead of the whole batch.
+        self.failed_image_targets: List[Tuple[str, str]] = []
 
         # --- Granular Status Tracking Fields ---
         self.current_status: str = "Initializing..."
@@ -46,14 +46,14 @@ class PipelineOrchestrator:
     ) -> RunContext:
         step_name = processor.__class__.__name__
         context.current_status = f"Running: {step_name}"
-        self.logger.info(f"--- ▶️ START: {step_name} ---")
+        self.logger.info("--- ▶️ START: %s ---", step_name)
         try:
             processed_context = await processor.process(context)
-            self.logger.info(f"--- ✅ END: {step_name} ---")
+            self.logger.info("--- ✅ END: %s ---", step_name)
             processed_context.record_artifact(step_name, processed_context.to_dict())
             return processed_context
         except Exception:
-            self.logger.error(f"--- ❌ FAILED: {step_name} ---", exc_info=True)
+            self.logger.error("--- ❌ FAILED: %s ---", step_name, exc_info=True)
             raise
 
     async def run(self, context: RunContext) -> bool:
@@ -62,12 +62,17 @@ class PipelineOrchestrator:
         Returns a boolean indicating if the result was served from cache.
         """
         self.logger.info(
-            f"▶️ PIPELINE START | Run ID: {context.run_id} | Seed: {context.variation_seed}"
+            "▶️ PIPELINE START | Run ID: %s | Seed: %s",
+            context.run_id,
+            context.variation_seed,
         )
         is_from_cache = False
 
         try:
             # --- STAGE 1: BRIEFING ---
+            # These steps cannot be batched or run concurrently: the consolidated
+            # briefing needs the deconstructed theme_hint, and the antagonist
+            # synthesis needs the brand ethos produced by the consolidated briefing.
             context.current_status = "Phase 1: Creative Briefing"
             context = await self._run_step(BriefDeconstructionProcessor(), context)
             context = await self._run_step(ConsolidatedBriefingProcessor(), context)
@@ -83,7 +88,8 @@ class PipelineOrchestrator:
                 )
             else:
                 self.logger.info(
-                    f"Variation seed is {context.variation_seed}. Bypassing L1 semantic cache to generate a new variation."
+                    "Variation seed is %s. Bypassing L1 semantic cache to generate a new variation.",
+                    context.variation_seed,
                 )
 
             if cached_payload_json:
@@ -97,13 +103,15 @@ class PipelineOrchestrator:
                     dest_path = context.results_dir
                     if source_path.exists():
                         self.logger.info(
-                            f"Restoring artifacts from '{source_path}' to '{dest_path}'..."
+                            "Restoring artifacts from '%s' to '%s'...",
+                            source_path,
+                            dest_path,
                         )
                         shutil.copytree(source_path, dest_path, dirs_exist_ok=True)
                         self.logger.info("✅ Artifact restoration complete.")
                     else:
                         self.logger.error(
-                            f"❌ Cached artifact path not found: {source_path}"
+                            "❌ Cached artifact path not found: %s", source_path
                         )
                 else:
                     self.logger.warning(
@@ -135,13 +143,14 @@ class PipelineOrchestrator:
                     context = await self._run_step(processor, context)
             except Exception as e:
                 self.logger.error(
-                    f"❌ Non-critical final output generation failed: {e}",
+                    "❌ Non-critical final output generation failed: %s",
+                    e,
                     exc_info=True,
                 )
 
         except Exception as e:
             self.logger.critical(
-                f"❌ PIPELINE HALTED due to a critical, unrecoverable error.",
+                "❌ PIPELINE HALTED due to a critical, unrecoverable error.",
                 exc_info=True,
             )
             raise
@@ -156,7 +165,7 @@ class PipelineOrchestrator:
                 self.logger.critical(
                     "❌ CRITICAL: Failed to save debug artifacts.", exc_info=True
                 )
-            self.logger.info(f"⏹️ PIPELINE FINISHED | Run ID: {context.run_id}")
+            self.logger.info("⏹️ PIPELINE FINISHED | Run ID: %s", context.run_id)
             context.is_complete = True
 
         return is_from_cache
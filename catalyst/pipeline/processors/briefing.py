@@ -5,12 +5,12 @@ This module contains the processors for the briefing stage, refactored for
 efficiency by consolidating multiple AI calls into a single, powerful step.
 """
 
-import json
 from datetime import datetime
 import asyncio
 from typing import Optional, Dict, Any, List, Union
 import re
 
+import orjson
 from pydantic import BaseModel, Field
 
 from catalyst.pipeline.base_processor import BaseProcessor
@@ -20,18 +20,32 @@ from ...prompts import prompt_library
 from ...resilience import invoke_with_resilience, MaxRetriesExceededError
 
 
+_SLUG_INVALID_CHARS_RE = re.compile(r"[^a-z0-9\s-]")
+_SLUG_ASCII_DELETE_TABLE = str.maketrans(
+    "",
+    "",
+    "".join(
+        ch
+        for ch in map(chr, range(128))
+        if not (ch.isalnum() or ch.isspace() or ch == "-")
+    ),
+)
+
+
 # --- Pydantic Models for Structured Output ---
 
 
 class StructuredBriefModel(BaseModel):
+    # The union fields use 'left_to_right' mode so validation stops at the
+    # first matching variant instead of scoring every member of the union.
     theme_hint: str
-    garment_type: Union[str, List[str]]
-    brand_category: Union[str, List[str]]
+    garment_type: Union[str, List[str]] = Field(union_mode="left_to_right")
+    brand_category: Union[str, List[str]] = Field(union_mode="left_to_right")
     target_audience: str
-    region: Union[str, List[str]]
+    region: Union[str, List[str]] = Field(union_mode="left_to_right")
     key_attributes: List[str]
-    season: Union[str, List[str]]
-    year: Union[str, int, List[Union[str, int]]]
+    season: Union[str, List[str]] = Field(union_mode="left_to_right")
+    year: Union[str, int, List[Union[str, int]]] = Field(union_mode="left_to_right")
     target_gender: str
     target_model_ethnicity: str
     target_age_group: str
@@ -77,8 +91,13 @@ class BriefDeconstructionProcessor(BaseProcessor):
         if not text:
             return "untitled"
         text = text.lower()
-        text = re.sub(r"[^a-z0-9\s-]", "", text)
-        text = re.sub(r"[\s-]+", "-", text).strip("-")
+        # Theme hints are almost always ASCII, where a translate table is much
+        # cheaper than the Unicode-aware regex.
+        if text.isascii():
+            text = text.translate(_SLUG_ASCII_DELETE_TABLE)
+        else:
+            text = _SLUG_INVALID_CHARS_RE.sub("", text)
+        text = "-".join(text.replace("-", " ").split())
         slug = text[:15]
         return slug.strip("-")
 
@@ -96,7 +115,7 @@ class BriefDeconstructionProcessor(BaseProcessor):
             initial_brief = self._apply_operational_defaults(brief_model.model_dump())
             context.enriched_brief = initial_brief
             context.theme_slug = self._create_slug(initial_brief.get("theme_hint"))
-            self.logger.info(f"✅ Generated theme slug: '{context.theme_slug}'")
+            self.logger.info("✅ Generated theme slug: '%s'", context.theme_slug)
             self.logger.info(
                 "✅ Success: Deconstructed and inferred a complete initial brief."
             )
@@ -111,13 +130,14 @@ class BriefDeconstructionProcessor(BaseProcessor):
             ) from e
 
     def _apply_operational_defaults(self, brief_data: Dict) -> Dict:
+        now = datetime.now()
         if brief_data.get("season") == "auto":
-            current_month = datetime.now().month
             brief_data["season"] = (
-                "Spring/Summer" if 4 <= current_month <= 9 else "Fall/Winter"
+                "Spring/Summer" if 4 <= now.month <= 9 else "Fall/Winter"
             )
-        if brief_data.get("year") == "auto" or not brief_data.get("year"):
-            brief_data["year"] = str(datetime.now().year)
+        year = brief_data.get("year")
+        if year == "auto" or not year:
+            brief_data["year"] = str(now.year)
         return brief_data
 
 
@@ -126,13 +146,15 @@ class ConsolidatedBriefingProcessor(BaseProcessor):
         self.logger.info(
             "🔬 Performing consolidated briefing (ethos, concepts, keywords)..."
         )
+        brief = context.enriched_brief
+        theme_hint = brief.get("theme_hint", "")
         try:
             prompt = prompt_library.CONSOLIDATED_BRIEFING_PROMPT.format(
                 user_passage=context.user_passage,
-                theme_hint=context.enriched_brief.get("theme_hint", ""),
-                briefing_schema=json.dumps(
+                theme_hint=theme_hint,
+                briefing_schema=orjson.dumps(
                     ConsolidatedBriefingModel.model_json_schema()
-                ),
+                ).decode(),
             )
             briefing_model = await invoke_with_resilience(
                 ai_function=gemini.generate_content_async,
@@ -140,21 +162,19 @@ class ConsolidatedBriefingProcessor(BaseProcessor):
                 response_schema=ConsolidatedBriefingModel,
             )
             context.brand_ethos = briefing_model.ethos
-            context.enriched_brief["expanded_concepts"] = (
-                briefing_model.expanded_concepts
-            )
-            search_keywords = set(context.enriched_brief.get("search_keywords", []))
-            if context.enriched_brief.get("theme_hint"):
-                search_keywords.add(context.enriched_brief["theme_hint"])
+            brief["expanded_concepts"] = briefing_model.expanded_concepts
+            search_keywords = set(brief.get("search_keywords") or ())
             search_keywords.update(briefing_model.search_keywords)
-            context.enriched_brief["search_keywords"] = sorted(list(search_keywords))
+            if theme_hint:
+                search_keywords.add(theme_hint)
+            brief["search_keywords"] = sorted(search_keywords)
             self.logger.info("✅ Success: Consolidated briefing complete.")
         except MaxRetriesExceededError:
             self.logger.warning(
                 "⚠️ Consolidated briefing failed. Proceeding with minimal data."
             )
             context.brand_ethos = ""
-            context.enriched_brief["expanded_concepts"] = []
+            brief["expanded_concepts"] = []
         return context
 
 
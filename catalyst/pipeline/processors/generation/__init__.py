@@ -1,9 +1,77 @@
+from typing import Optional, Tuple
+
+import httpx
+from openai import AsyncOpenAI
+
 from catalyst import settings
 from .base_generator import BaseImageGenerator
 from .dalle3_generator import DalleImageGeneration
 from .gpt_image1_generator import GptImage1Generation
 from .nanobanana_generator import NanoBananaGeneration  # <-- ADD THIS IMPORT
 
+_shared_http_client: Optional[httpx.AsyncClient] = None
+_shared_openai_client: Optional[AsyncOpenAI] = None
+
+
+def _get_shared_openai_clients() -> Tuple[AsyncOpenAI, httpx.AsyncClient]:
+    """
+    Lazily builds a single pooled HTTP client, and an OpenAI client on top of
+    it, shared by every OpenAI-backed generator. Concurrent image requests
+    then reuse keep-alive connections instead of each generator opening and
+    handshaking its own pool.
+    """
+    global _shared_http_client, _shared_openai_client
+    if _shared_openai_client is None or _shared_http_client is None:
+        _shared_http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(120.0),
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+        # The SDK retries 429/5xx itself with jittered exponential backoff.
+        _shared_openai_client = AsyncOpenAI(
+            api_key=settings.DALLE_API_KEY,
+            http_client=_shared_http_client,
+            max_retries=settings.IMAGE_GENERATION_MAX_RETRIES,
+        )
+    return _shared_openai_client, _shared_http_client
+
+
+async def close_openai_client() -> None:
+    """
+    Closes the shared OpenAI connection pool, if one was opened. The next
+    OpenAI-backed generator builds a fresh one.
+    """
+    global _shared_http_client, _shared_openai_client
+    if _shared_http_client is not None:
+        await _shared_http_client.aclose()
+    _shared_http_client = None
+    _shared_openai_client = None
+
+
+async def prewarm_openai_client() -> None:
+    """
+    Opens the shared OpenAI connection pool ahead of the first image batch
+    with a cheap model-metadata lookup, so the first generation request does
+    not pay the TCP/TLS handshake. Does nothing for non-OpenAI models.
+    """
+    model_name = settings.IMAGE_GENERATION_MODEL.lower()
+    if model_name not in ("dall-e-3", "gpt-image-1"):
+        return
+
+    from catalyst.utilities.logger import get_logger
+
+    logger = get_logger(__name__)
+    openai_client, _ = _get_shared_openai_clients()
+    # The probe shares the pool but not the retry budget or the long timeout
+    # of real image requests.
+    probe_client = openai_client.with_options(
+        max_retries=0, timeout=settings.PREWARM_TIMEOUT_SECONDS
+    )
+    try:
+        await probe_client.models.retrieve(model_name)
+        logger.info("🔥 OpenAI client connection pre-warmed.")
+    except Exception as e:
+        logger.warning("⚠️ Could not pre-warm the OpenAI client: %s", e)
+
 
 def get_image_generator() -> BaseImageGenerator:
     """
@@ -13,9 +81,11 @@ def get_image_generator() -> BaseImageGenerator:
     model_name = settings.IMAGE_GENERATION_MODEL.lower()
 
     if model_name == "dall-e-3":
-        return DalleImageGeneration() # type: ignore
+        openai_client, http_client = _get_shared_openai_clients()
+        return DalleImageGeneration(client=openai_client, http_client=http_client)
     elif model_name == "gpt-image-1":
-        return GptImage1Generation() # type: ignore
+        openai_client, _ = _get_shared_openai_clients()
+        return GptImage1Generation(client=openai_client)
     elif model_name == "nano-banana":  # <-- ADD THIS BLOCK
         return NanoBananaGeneration()
     else:
@@ -23,6 +93,6 @@ def get_image_generator() -> BaseImageGenerator:
 
         logger = get_logger(__name__)
         logger.warning(
-            f"Invalid IMAGE_GENERATION_MODEL '{model_name}'. Defaulting to 'dall-e-3'."
+            "Invalid IMAGE_GENERATION_MODEL '%s'. Defaulting to 'dall-e-3'.", model_name
         )
         return NanoBananaGeneration()
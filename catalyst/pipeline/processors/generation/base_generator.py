@@ -1,14 +1,275 @@
 # catalyst/pipeline/processors/generation/base_generator.py
 
+import asyncio
+import os
+import re
+import shutil
+import uuid
 from abc import abstractmethod
-from typing import Optional
+from pathlib import Path
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import orjson
+import pybase64
+
 from catalyst.context import RunContext
 from catalyst.pipeline.base_processor import BaseProcessor
+from catalyst import settings
+
+T = TypeVar("T")
+
+# Compiled once at import time and shared by every concurrent generation task.
+_PROMPT_MARKDOWN_RE = re.compile(r"\*\*.*?\*\*|^- ", re.MULTILINE)
+
+# Deletion table for every ASCII character a filename slug may not contain.
+_SLUG_ASCII_DELETE_TABLE = str.maketrans(
+    "",
+    "",
+    "".join(ch for ch in map(chr, range(128)) if not (ch.isalnum() or ch in " -")),
+)
+
+
+def slugify(name: str) -> str:
+    """
+    Turns a garment name into a filename slug, keeping only alphanumerics,
+    spaces and hyphens, with spaces converted to hyphens.
+    """
+    lowered = name.lower()
+    if lowered.isascii():
+        # Fast path: str.translate filters the whole name at C level.
+        return lowered.translate(_SLUG_ASCII_DELETE_TABLE).replace(" ", "-")
+    return "".join(c for c in lowered if c.isalnum() or c in " -").replace(" ", "-")
+
+
+def clean_prompt(prompt: str) -> str:
+    """
+    Strips markdown emphasis and list markers from a generated prompt and
+    collapses it into a single line for the image APIs.
+    """
+    # str.split() already treats newlines as whitespace, so one split/join
+    # collapses and trims every run in a single C-level pass.
+    return " ".join(_PROMPT_MARKDOWN_RE.sub("", prompt).split())
+
+
+def _replace_atomically(path: Path, write: Callable[[Path], object]) -> None:
+    """
+    Calls `write` on a uniquely named temporary file beside `path` and renames
+    the result into place, so a crash or cancellation mid-write never leaves
+    a truncated file at `path`.
+    """
+    temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        write(temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_atomic(data: bytes, path: Path) -> None:
+    """Writes `data` to `path` atomically."""
+    _replace_atomically(path, lambda temp_path: temp_path.write_bytes(data))
+
+
+def copy_atomic(source: Path, destination: Path) -> None:
+    """Copies `source` to `destination` atomically."""
+    _replace_atomically(
+        destination, lambda temp_path: shutil.copyfile(source, temp_path)
+    )
+
+
+def decode_and_write_image(image_data_b64: str, image_path: Path) -> None:
+    """
+    Decodes a base64 image payload and writes it to disk atomically. This is
+    CPU- and IO-bound, so generators run it via asyncio.to_thread to keep the
+    event loop free while other image requests are in flight.
+    """
+    write_atomic(pybase64.b64decode(image_data_b64, validate=True), image_path)
+
+
+def group_prompt_targets(
+    prompts_data: Dict[str, Dict[str, str]],
+) -> Tuple[Dict[str, List[Tuple[str, str]]], List[Tuple[str, str]]]:
+    """
+    Flattens the prompts file into (garment_name, prompt_type) targets grouped
+    by cleaned prompt, so identical prompts are only generated once. Returns
+    the grouping plus the targets whose prompt is empty once cleaned.
+    """
+    targets_by_prompt: Dict[str, List[Tuple[str, str]]] = {}
+    skipped: List[Tuple[str, str]] = []
+    for garment_name, prompts in prompts_data.items():
+        for prompt_type, prompt_text in prompts.items():
+            cleaned = clean_prompt(prompt_text) if prompt_text else ""
+            if cleaned:
+                targets_by_prompt.setdefault(cleaned, []).append(
+                    (garment_name, prompt_type)
+                )
+            else:
+                skipped.append((garment_name, prompt_type))
+    return targets_by_prompt, skipped
+
+
+async def gather_bounded(
+    coros: Iterable[Awaitable[T]], limit: int, return_exceptions: bool = False
+) -> List[Union[T, BaseException]]:
+    """
+    Runs the awaitables concurrently like asyncio.gather, but with at most
+    `limit` of them in flight at once so a large collection does not trip
+    the image provider's rate limits. A fixed pool of workers pulls from
+    `coros` lazily, so a generator argument is only materialized `limit`
+    items at a time. Results are returned in input order; with
+    `return_exceptions`, a failing awaitable's exception takes its place
+    instead of propagating. Otherwise the first failure cancels the other
+    workers, so no further jobs are started once the batch has failed.
+    """
+    if limit < 1:
+        raise ValueError(f"gather_bounded limit must be at least 1, got {limit}.")
+    jobs = enumerate(coros)
+    results: Dict[int, Union[T, BaseException]] = {}
+
+    async def _worker() -> None:
+        # Workers share one iterator; next() never yields to the event loop,
+        # so each job is claimed by exactly one worker.
+        for index, coro in jobs:
+            try:
+                results[index] = await coro
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results[index] = e
+
+    workers = [asyncio.create_task(_worker()) for _ in range(limit)]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        raise
+    return [results[index] for index in range(len(results))]
 
 
 class BaseImageGenerator(BaseProcessor):
+    """
+    Abstract base for every image generation strategy. All strategies share
+    one `process` signature so the factory and the regeneration worker can
+    call any of them interchangeably.
+    """
+
     @abstractmethod
     async def process(
-        self, context: RunContext, temperature_override: Optional[float] = None
+        self,
+        context: RunContext,
+        *,
+        temperature_override: Optional[float] = None,
+        force_regenerate: bool = False,
     ) -> RunContext:
+        """
+        Generates images for every prompt in the run. `temperature_override`
+        is only honoured by models that expose a sampling temperature.
+        `force_regenerate` asks for fresh images even where an existing file
+        or cached image could be reused; it only matters to generators that
+        reuse images.
+        """
         pass
+
+    def _load_prompts_from_file(self, context: RunContext) -> dict:
+        """
+        Reads the run's prompts file and caches it on the context, returning
+        {} if it is missing or cannot be parsed.
+        """
+        try:
+            prompts_path = context.results_dir / settings.PROMPTS_FILENAME
+            if prompts_path.exists():
+                context.prompts_data = orjson.loads(prompts_path.read_bytes())
+                return context.prompts_data
+            else:
+                self.logger.warning(
+                    "⚠️ Prompts file not found at %s. Cannot generate images.",
+                    prompts_path,
+                )
+                return {}
+        except Exception:
+            self.logger.error(
+                "❌ Could not load or parse prompts from file.", exc_info=True
+            )
+            return {}
+
+    async def _load_prompts(self, context: RunContext) -> dict:
+        """
+        Returns the run's prompts. A cache miss means reading and parsing the
+        prompts file, which is done in a worker thread so it does not stall
+        other tasks on the event loop.
+        """
+        if context.prompts_data is not None:
+            return context.prompts_data
+        return await asyncio.to_thread(self._load_prompts_from_file, context)
+
+    def _results_dir_is_writable(self, context: RunContext) -> bool:
+        """
+        Checks that images can be saved before any request is paid for, so a
+        bad results directory fails once instead of after every generation.
+        """
+        probe_path = context.results_dir / ".write_probe"
+        try:
+            context.results_dir.mkdir(parents=True, exist_ok=True)
+            probe_path.touch()
+            probe_path.unlink()
+        except OSError as e:
+            self.logger.critical(
+                "❌ Results directory '%s' is not writable: %s. Aborting generation.",
+                context.results_dir,
+                e,
+            )
+            return False
+        return True
+
+    def _image_path(
+        self,
+        context: RunContext,
+        garment_name: str,
+        prompt_type: str,
+        suffix: str = "",
+    ) -> Path:
+        """
+        Builds the output path for a garment, with a marker for mood boards.
+        `suffix` is appended to the file stem, e.g. to tag the temperature.
+        """
+        slug = slugify(garment_name)
+
+        # --- START OF MOOD BOARD FIX ---
+        # Use a different filename for the mood board image.
+        if prompt_type == "mood_board":
+            image_filename = f"{slug}-moodboard{suffix}.png"
+        else:
+            image_filename = f"{slug}{suffix}.png"
+        # --- END OF MOOD BOARD FIX ---
+
+        return context.results_dir / image_filename
+
+    async def _copy_to_duplicates(
+        self,
+        image_path: Path,
+        context: RunContext,
+        duplicates: Sequence[Tuple[str, str]],
+    ):
+        """Copies an image to the paths of garments that shared its prompt."""
+        for garment_name, prompt_type in duplicates:
+            duplicate_path = self._image_path(context, garment_name, prompt_type)
+            await asyncio.to_thread(copy_atomic, image_path, duplicate_path)
+            self.logger.info(
+                "✅ Reused image for '%s' (identical prompt) at '%s'",
+                garment_name,
+                duplicate_path,
+            )
@@ -1,14 +1,18 @@
 # catalyst/pipeline/processors/generation/dalle3_generator.py
 
 import asyncio
-import base64
-import json
-import re
 from pathlib import Path
+from typing import Optional, Sequence, Tuple
 
+import httpx
 from openai import AsyncOpenAI
 
-from .base_generator import BaseImageGenerator
+from .base_generator import (
+    BaseImageGenerator,
+    gather_bounded,
+    group_prompt_targets,
+    write_atomic,
+)
 from catalyst.context import RunContext
 from catalyst import settings
 
@@ -20,17 +24,35 @@ class DalleImageGeneration(BaseImageGenerator):
     and creates images concurrently.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        client: Optional[AsyncOpenAI] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         super().__init__()
-        self.client = AsyncOpenAI(api_key=settings.DALLE_API_KEY)
+        self.client = client or AsyncOpenAI(
+            api_key=settings.DALLE_API_KEY,
+            max_retries=settings.IMAGE_GENERATION_MAX_RETRIES,
+        )
+        # Without an injected pool, each download opens and closes its own
+        # client, so a standalone generator never leaks open connections.
+        self.http_client = http_client
         from catalyst.utilities.logger import get_logger
 
         self.logger = get_logger(self.__class__.__name__)
 
-    async def generate_images(self, context: RunContext) -> RunContext:
+    async def process(
+        self,
+        context: RunContext,
+        *,
+        temperature_override: Optional[float] = None,
+        force_regenerate: bool = False,
+    ) -> RunContext:
         """
         Creates a list of all image generation tasks for all prompt types
-        and runs them in parallel.
+        and runs them in parallel. DALL-E 3 has no sampling temperature and
+        never reuses images, so `temperature_override` and `force_regenerate`
+        are accepted for interface parity and ignored.
         """
         self.logger.info("🎨 Activating DALL-E 3 image generation strategy...")
 
@@ -40,7 +62,7 @@ class DalleImageGeneration(BaseImageGenerator):
             )
             return context
 
-        prompts_data = self._load_prompts_from_file(context)
+        prompts_data = await self._load_prompts(context)
         if not prompts_data:
             self.logger.error(
                 "❌ Could not load any prompts to generate images. Halting generation."
@@ -50,51 +72,62 @@ class DalleImageGeneration(BaseImageGenerator):
         self.logger.info(
             "Building a list of all image generation tasks to run in parallel..."
         )
-        tasks = []
-        # --- START OF MOOD BOARD FIX ---
-        # Iterate over each garment and its associated dictionary of prompts.
-        for garment_name, prompts in prompts_data.items():
-            # Iterate over each prompt type (e.g., "final_garment", "mood_board").
-            for prompt_type, prompt_text in prompts.items():
-                if not prompt_text:
-                    self.logger.warning(
-                        f"⚠️ No prompt text found for '{prompt_type}' on '{garment_name}'. Skipping."
-                    )
-                    continue
-
-                # Create a task for each valid prompt.
-                task = self._generate_and_save_image(
-                    prompt_text, garment_name, context, prompt_type
-                )
-                tasks.append(task)
-        # --- END OF MOOD BOARD FIX ---
+        # Garments that share keywords often end up with identical prompts, so
+        # targets are grouped by cleaned prompt and each one is only paid for
+        # (and downloaded/decoded) once.
+        targets_by_prompt, skipped = group_prompt_targets(prompts_data)
+        for garment_name, prompt_type in skipped:
+            self.logger.warning(
+                "⚠️ No prompt text found for '%s' on '%s'. Skipping.",
+                prompt_type,
+                garment_name,
+            )
 
-        if not tasks:
+        if not targets_by_prompt:
             self.logger.warning("No valid image generation tasks were created.")
             return context
 
+        if not self._results_dir_is_writable(context):
+            return context
+
         self.logger.info(
-            f"🚀 Launching {len(tasks)} image generation tasks in parallel..."
+            "🚀 Launching %d image generation tasks in parallel...",
+            len(targets_by_prompt),
+        )
+        await gather_bounded(
+            (
+                self._generate_and_save_image(
+                    cleaned_prompt, garment_name, context, prompt_type, duplicates
+                )
+                for cleaned_prompt, (
+                    (garment_name, prompt_type),
+                    *duplicates,
+                ) in targets_by_prompt.items()
+            ),
+            settings.IMAGE_GENERATION_MAX_CONCURRENCY,
         )
-        await asyncio.gather(*tasks)
 
         self.logger.info("✅ DALL-E 3 image generation complete.")
         return context
 
     async def _generate_and_save_image(
-        self, prompt: str, garment_name: str, context: RunContext, prompt_type: str
+        self,
+        cleaned_prompt: str,
+        garment_name: str,
+        context: RunContext,
+        prompt_type: str,
+        duplicates: Sequence[Tuple[str, str]] = (),
     ):
         """
-        Generates and saves a single image with a filename based on the prompt type.
+        Generates and saves a single image with a filename based on the prompt type,
+        then copies it to any duplicate targets that shared the same prompt.
         """
-        self.logger.info(
-            f"Cleaning prompt for DALL-E 3: '{garment_name}' ({prompt_type})..."
-        )
-        cleaned_prompt = re.sub(r"\*\*.*?\*\*|^- ", "", prompt, flags=re.MULTILINE)
-        cleaned_prompt = cleaned_prompt.replace("\n", " ")
-        cleaned_prompt = " ".join(cleaned_prompt.split())
+        # Resolved before the request so the post-response path is I/O only.
+        image_path = self._image_path(context, garment_name, prompt_type)
 
-        self.logger.info(f"Generating image for: '{garment_name}' ({prompt_type})...")
+        self.logger.debug(
+            "Generating image for: '%s' (%s)...", garment_name, prompt_type
+        )
         try:
             response = await self.client.images.generate(
                 model="dall-e-3",
@@ -102,61 +135,44 @@ class DalleImageGeneration(BaseImageGenerator):
                 size="1024x1024",
                 quality="hd",
                 n=1,
-                response_format="b64_json",
+                response_format="url",
             )
 
-            if response.data and response.data[0].b64_json:
-                image_data_b64 = response.data[0].b64_json
-                image_data = base64.b64decode(image_data_b64)
+            if response.data and response.data[0].url:
+                await self._download_image(response.data[0].url, image_path)
 
-                slug = "".join(
-                    c for c in garment_name.lower() if c.isalnum() or c in " -"
-                ).replace(" ", "-")
-
-                # --- START OF MOOD BOARD FIX ---
-                # Use a different filename for the mood board image.
-                if prompt_type == "mood_board":
-                    image_filename = f"{slug}-moodboard.png"
-                else:
-                    image_filename = f"{slug}.png"
-                # --- END OF MOOD BOARD FIX ---
-
-                image_path = Path(context.results_dir) / image_filename
-
-                with open(image_path, "wb") as f:
-                    f.write(image_data)
-
-                self.logger.info(f"✅ Successfully saved image to '{image_path}'")
+                self.logger.info("✅ Successfully saved image to '%s'", image_path)
+                await self._copy_to_duplicates(image_path, context, duplicates)
             else:
                 revised_prompt = (
                     response.data[0].revised_prompt if response.data else "N/A"
                 )
                 self.logger.error(
-                    f"❌ DALL-E 3 API call for '{garment_name}' was successful but returned no image data. "
-                    f"This may be due to a content filter. Revised prompt was: '{revised_prompt}'"
+                    "❌ DALL-E 3 API call for '%s' was successful but returned no image data. "
+                    "This may be due to a content filter. Revised prompt was: '%s'",
+                    garment_name,
+                    revised_prompt,
                 )
 
         except Exception as e:
             self.logger.error(
-                f"❌ DALL-E 3 API call failed for '{garment_name}': {e}",
+                "❌ DALL-E 3 API call failed for '%s': %s",
+                garment_name,
+                e,
                 exc_info=True,
             )
 
-    def _load_prompts_from_file(self, context: RunContext) -> dict:
-        """A fallback to load prompts directly from the JSON file if needed."""
-        try:
-            prompts_path = Path(context.results_dir) / settings.PROMPTS_FILENAME
-            if prompts_path.exists():
-                with open(prompts_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            else:
-                self.logger.warning(
-                    f"⚠️ Prompts file not found at {prompts_path}. Cannot generate images."
-                )
-                return {}
-        except Exception:
-            self.logger.error(
-                "❌ Could not load or parse prompts from file as a fallback.",
-                exc_info=True,
-            )
-            return {}
+    async def _download_image(self, url: str, image_path: Path):
+        """
+        Downloads the generated PNG from its hosted URL, which avoids the ~33%
+        base64 overhead on the wire and the decode step. The file is written
+        atomically off the event loop, so a failed download never leaves a
+        truncated image behind.
+        """
+        if self.http_client is not None:
+            response = await self.http_client.get(url)
+        else:
+            async with httpx.AsyncClient(timeout=60.0) as http_client:
+                response = await http_client.get(url)
+        response.raise_for_status()
+        await asyncio.to_thread(write_atomic, response.content, image_path)
@@ -1,14 +1,16 @@
 # catalyst/pipeline/processors/generation/gpt_image1_generator.py
 
 import asyncio
-import base64
-import json
-import re
-from pathlib import Path
+from typing import Optional, Sequence, Tuple
 
 from openai import AsyncOpenAI
 
-from .base_generator import BaseImageGenerator
+from .base_generator import (
+    BaseImageGenerator,
+    decode_and_write_image,
+    gather_bounded,
+    group_prompt_targets,
+)
 from catalyst.context import RunContext
 from catalyst import settings
 
@@ -19,16 +21,28 @@ class GptImage1Generation(BaseImageGenerator):
     It generates all images (final garment and mood board) in parallel.
     """
 
-    def __init__(self):
+    def __init__(self, client: Optional[AsyncOpenAI] = None):
         super().__init__()
-        self.client = AsyncOpenAI(api_key=settings.DALLE_API_KEY)
+        self.client = client or AsyncOpenAI(
+            api_key=settings.DALLE_API_KEY,
+            max_retries=settings.IMAGE_GENERATION_MAX_RETRIES,
+        )
         from catalyst.utilities.logger import get_logger
 
         self.logger = get_logger(self.__class__.__name__)
 
-    async def generate_images(self, context: RunContext) -> RunContext:
+    async def process(
+        self,
+        context: RunContext,
+        *,
+        temperature_override: Optional[float] = None,
+        force_regenerate: bool = False,
+    ) -> RunContext:
         """
         Creates a list of all image generation tasks and runs them in parallel.
+        GPT-Image-1 has no sampling temperature and never reuses images, so
+        `temperature_override` and `force_regenerate` are accepted for
+        interface parity and ignored.
         """
         self.logger.info("🎨 Activating legacy GPT-Image-1 generation strategy...")
 
@@ -38,7 +52,7 @@ class GptImage1Generation(BaseImageGenerator):
             )
             return context
 
-        prompts_data = self._load_prompts_from_file(context)
+        prompts_data = await self._load_prompts(context)
         if not prompts_data:
             self.logger.error(
                 "❌ Could not load any prompts to generate images. Halting generation."
@@ -48,45 +62,62 @@ class GptImage1Generation(BaseImageGenerator):
         self.logger.info(
             "Building a list of image generation tasks to run in parallel..."
         )
-        tasks = []
-        # --- START OF MOOD BOARD FIX ---
-        for garment_name, prompts in prompts_data.items():
-            for prompt_type, prompt_text in prompts.items():
-                if not prompt_text:
-                    self.logger.warning(
-                        f"⚠️ No prompt text found for '{prompt_type}' on '{garment_name}'. Skipping."
-                    )
-                    continue
-                task = self._generate_and_save_image(
-                    prompt_text, garment_name, context, prompt_type
-                )
-                tasks.append(task)
-        # --- END OF MOOD BOARD FIX ---
+        # Garments that share keywords often end up with identical prompts, so
+        # targets are grouped by cleaned prompt and each one is only paid for
+        # (and downloaded/decoded) once.
+        targets_by_prompt, skipped = group_prompt_targets(prompts_data)
+        for garment_name, prompt_type in skipped:
+            self.logger.warning(
+                "⚠️ No prompt text found for '%s' on '%s'. Skipping.",
+                prompt_type,
+                garment_name,
+            )
 
-        if not tasks:
+        if not targets_by_prompt:
             self.logger.warning("No valid image generation tasks were created.")
             return context
 
+        if not self._results_dir_is_writable(context):
+            return context
+
         self.logger.info(
-            f"🚀 Launching {len(tasks)} image generation tasks in parallel..."
+            "🚀 Launching %d image generation tasks in parallel...",
+            len(targets_by_prompt),
+        )
+        await gather_bounded(
+            (
+                self._generate_and_save_image(
+                    cleaned_prompt, garment_name, context, prompt_type, duplicates
+                )
+                for cleaned_prompt, (
+                    (garment_name, prompt_type),
+                    *duplicates,
+                ) in targets_by_prompt.items()
+            ),
+            settings.IMAGE_GENERATION_MAX_CONCURRENCY,
         )
-        await asyncio.gather(*tasks)
 
         self.logger.info("✅ All GPT-Image-1 generation tasks complete.")
         return context
 
     async def _generate_and_save_image(
-        self, prompt: str, garment_name: str, context: RunContext, prompt_type: str
+        self,
+        cleaned_prompt: str,
+        garment_name: str,
+        context: RunContext,
+        prompt_type: str,
+        duplicates: Sequence[Tuple[str, str]] = (),
     ):
-        """Generates a single image and saves it to the results directory."""
-        self.logger.info(
-            f"Cleaning prompt for GPT-Image-1: '{garment_name}' ({prompt_type})..."
-        )
-        cleaned_prompt = re.sub(r"\*\*.*?\*\*|^- ", "", prompt, flags=re.MULTILINE)
-        cleaned_prompt = cleaned_prompt.replace("\n", " ")
-        cleaned_prompt = " ".join(cleaned_prompt.split())
+        """
+        Generates a single image and saves it to the results directory, then
+        copies it to any duplicate targets that shared the same prompt.
+        """
+        # Resolved before the request so the post-response path is I/O only.
+        image_path = self._image_path(context, garment_name, prompt_type)
 
-        self.logger.info(f"Generating image for: '{garment_name}' ({prompt_type})...")
+        self.logger.debug(
+            "Generating image for: '%s' (%s)...", garment_name, prompt_type
+        )
         try:
             response = await self.client.images.generate(
                 model="gpt-image-1",
@@ -99,57 +130,29 @@ class GptImage1Generation(BaseImageGenerator):
             if response.data and len(response.data) > 0:
                 image_item = response.data[0]
                 if hasattr(image_item, "b64_json") and image_item.b64_json:
-                    image_data = base64.b64decode(image_item.b64_json)
-
-                    slug = "".join(
-                        c for c in garment_name.lower() if c.isalnum() or c in " -"
-                    ).replace(" ", "-")
-
-                    # --- START OF MOOD BOARD FIX ---
-                    if prompt_type == "mood_board":
-                        image_filename = f"{slug}-moodboard.png"
-                    else:
-                        image_filename = f"{slug}.png"
-                    # --- END OF MOOD BOARD FIX ---
-
-                    image_path = Path(context.results_dir) / image_filename
-
-                    with open(image_path, "wb") as f:
-                        f.write(image_data)
+                    await asyncio.to_thread(
+                        decode_and_write_image, image_item.b64_json, image_path
+                    )
 
-                    self.logger.info(f"✅ Successfully saved image to '{image_path}'")
+                    self.logger.info("✅ Successfully saved image to '%s'", image_path)
+                    await self._copy_to_duplicates(image_path, context, duplicates)
                 else:
                     revised_prompt = getattr(image_item, "revised_prompt", "N/A")
                     self.logger.error(
-                        f"❌ GPT Image API call for '{garment_name}' returned no image data. "
-                        f"Revised prompt was: '{revised_prompt}'"
+                        "❌ GPT Image API call for '%s' returned no image data. "
+                        "Revised prompt was: '%s'",
+                        garment_name,
+                        revised_prompt,
                     )
             else:
                 self.logger.error(
-                    f"❌ GPT Image API call for '{garment_name}' returned no data."
+                    "❌ GPT Image API call for '%s' returned no data.", garment_name
                 )
 
         except Exception as e:
             self.logger.error(
-                f"❌ GPT Image API call failed for '{garment_name}': {e}",
-                exc_info=True,
-            )
-
-    def _load_prompts_from_file(self, context: RunContext) -> dict:
-        """A fallback to load prompts directly from the JSON file if needed."""
-        try:
-            prompts_path = Path(context.results_dir) / settings.PROMPTS_FILENAME
-            if prompts_path.exists():
-                with open(prompts_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            else:
-                self.logger.warning(
-                    f"⚠️ Prompts file not found at {prompts_path}. Cannot generate images."
-                )
-                return {}
-        except Exception:
-            self.logger.error(
-                "❌ Could not load or parse prompts from file as a fallback.",
+                "❌ GPT Image API call failed for '%s': %s",
+                garment_name,
+                e,
                 exc_info=True,
             )
-            return {}
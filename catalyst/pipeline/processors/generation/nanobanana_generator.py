@@ -1,21 +1,169 @@
 # catalyst/pipeline/processors/generation/nanobanana_generator.py
 
 import asyncio
+import hashlib
 import io
-import json
-import re
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from google import genai
 from google.genai import types
 from google.genai.types import HarmCategory, HarmBlockThreshold
 from PIL import Image
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception,
+    stop_after_attempt,
+)
 
-from .base_generator import BaseImageGenerator
+from .base_generator import (
+    BaseImageGenerator,
+    gather_bounded,
+    group_prompt_targets,
+    write_atomic,
+)
+from catalyst.clients.gemini import client_instance
+from catalyst.clients.gemini.resilience import (
+    MAX_RETRY_DELAY_SECONDS,
+    calculate_full_jitter_delay,
+    get_retry_after_delay,
+    should_retry,
+)
 from catalyst.context import RunContext
+from catalyst.resilience import AsyncRateLimiter
 from catalyst import settings
 
+# Invariant across every request, so built once at import time.
+_SAFETY_SETTINGS = [
+    types.SafetySetting(category=cat, threshold=HarmBlockThreshold.BLOCK_NONE)
+    for cat in [
+        HarmCategory.HARM_CATEGORY_HARASSMENT,
+        HarmCategory.HARM_CATEGORY_HATE_SPEECH,
+        HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
+        HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
+    ]
+]
+
+
+class _EmptyImageResponse(Exception):
+    """Raised when Gemini answers successfully but without any image data."""
+
+
+def _is_retryable(e: BaseException) -> bool:
+    """Retries empty responses and transient API errors, never permanent ones."""
+    return isinstance(e, _EmptyImageResponse) or (
+        isinstance(e, Exception) and should_retry(e)
+    )
+
+
+def _wait_for_retry(retry_state: RetryCallState) -> float:
+    """
+    Honours the server's cooldown on a 429, capped at the backoff ceiling so a
+    huge or bogus Retry-After cannot hold a worker slot; otherwise backs off
+    exponentially with full jitter so parallel tasks don't retry in step.
+    """
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    retry_after = get_retry_after_delay(error) if error else None
+    if retry_after is not None:
+        return min(max(retry_after, 0.0), MAX_RETRY_DELAY_SECONDS)
+    return calculate_full_jitter_delay(retry_state.attempt_number - 1)
+
+
+def _extract_image_bytes(response: Any) -> Optional[bytes]:
+    """Returns the first inline image in a Gemini response, skipping text parts."""
+    if not (
+        response.candidates
+        and response.candidates[0].content
+        and response.candidates[0].content.parts
+    ):
+        return None
+    for part in response.candidates[0].content.parts:
+        inline_data = part.inline_data
+        if inline_data and inline_data.data:
+            return inline_data.data
+    return None
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _encode_png(image_bytes: bytes, max_edge: Optional[int] = None) -> bytes:
+    """
+    Returns the image as PNG bytes. Gemini normally returns PNG already, in
+    which case the bytes are passed through as-is; anything else, or an image
+    whose longest edge exceeds `max_edge`, is re-encoded through Pillow.
+    """
+    is_png = image_bytes.startswith(_PNG_SIGNATURE)
+    if is_png and not max_edge:
+        return image_bytes
+    # Pillow only parses the header here; pixels are decoded on demand.
+    image = Image.open(io.BytesIO(image_bytes))
+    if max_edge and max(image.size) > max_edge:
+        image.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+    elif is_png:
+        return image_bytes
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG", compress_level=settings.IMAGE_PNG_COMPRESS_LEVEL)
+    return buffer.getvalue()
+
+
+def _image_cache_key(
+    cleaned_prompt: str, temperature: float, variation_seed: int = 0
+) -> str:
+    """
+    Identifies a generated image by everything that shapes the request. The
+    variation seed is included so a variation run never reuses the images of
+    the run it is meant to differ from, even when its prompts are unchanged.
+    """
+    key = (
+        f"{settings.IMAGE_GENERATION_MODEL_NAME}|{temperature}|"
+        f"{variation_seed}|{cleaned_prompt}"
+    )
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _prune_image_cache(cache_dir: Path, max_bytes: int) -> None:
+    """
+    Deletes cached images, least recently used first, until the cache fits in
+    `max_bytes`. A cache hit refreshes the file's mtime, so mtime order is
+    recency order.
+    """
+    entries = []
+    for path in cache_dir.glob("*.png"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total_bytes = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_bytes <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total_bytes -= size
+
+
+_shared_rate_limiter: Optional[AsyncRateLimiter] = None
+
+
+def _get_shared_rate_limiter() -> AsyncRateLimiter:
+    """
+    Lazily builds the process-wide limiter for Gemini image requests. A
+    generator is created per job and the worker runs several jobs at once,
+    so the quota is only respected if every instance draws from one bucket.
+    The burst capacity lets the first wave of concurrent requests start
+    without waiting.
+    """
+    global _shared_rate_limiter
+    if _shared_rate_limiter is None:
+        _shared_rate_limiter = AsyncRateLimiter(
+            settings.GEMINI_IMAGE_RPM,
+            capacity=settings.IMAGE_GENERATION_MAX_CONCURRENCY,
+        )
+    return _shared_rate_limiter
+
 
 class NanoBananaGeneration(BaseImageGenerator):
     """
@@ -23,10 +171,19 @@ class NanoBananaGeneration(BaseImageGenerator):
     now supporting prompt modification for variation and temperature for creativity.
     """
 
-    def __init__(self, client=None):
+    def __init__(
+        self,
+        client=None,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+        cache_dir: Optional[Path] = None,
+    ):
         super().__init__()
         self._client = client
         self._initialized_client = None
+        # Images are cached across runs by prompt, model, temperature and
+        # variation seed, so an unchanged prompt never pays for a second call.
+        self._cache_dir = cache_dir or settings.IMAGE_CACHE_DIR
+        self._rate_limiter = rate_limiter or _get_shared_rate_limiter()
 
     def _get_client(self):
         if self._initialized_client:
@@ -35,6 +192,11 @@ class NanoBananaGeneration(BaseImageGenerator):
             self._initialized_client = self._client
             return self._client
         if settings.GEMINI_API_KEY:
+            # Reuse the process-wide client so image requests share the text
+            # pipeline's (pre-warmed) connection pool instead of opening their own.
+            if client_instance.client is not None:
+                self._initialized_client = client_instance.client
+                return self._initialized_client
             try:
                 self._initialized_client = genai.Client(api_key=settings.GEMINI_API_KEY)
                 self.logger.info(
@@ -43,7 +205,7 @@ class NanoBananaGeneration(BaseImageGenerator):
                 return self._initialized_client
             except Exception as e:
                 self.logger.critical(
-                    f"CRITICAL: Failed to configure Gemini client: {e}", exc_info=True
+                    "CRITICAL: Failed to configure Gemini client: %s", e, exc_info=True
                 )
         self.logger.critical(
             "CRITICAL: GEMINI_API_KEY not set. Nano Banana generator is disabled."
@@ -51,164 +213,277 @@ class NanoBananaGeneration(BaseImageGenerator):
         return None
 
     async def process(
-        self, context: RunContext, temperature_override: Optional[float] = None,
+        self,
+        context: RunContext,
+        *,
+        temperature_override: Optional[float] = None,
+        force_regenerate: bool = False,
     ) -> RunContext:
         client = self._get_client()
         if not client:
-            self.logger.critical("❌ Gemini client is not available. Aborting generation.")
+            self.logger.critical(
+                "❌ Gemini client is not available. Aborting generation."
+            )
             return context
         temp_to_use = temperature_override or 0.7
         self.logger.info(
-            f"🎨 Activating Nano Banana generation with temp: {temp_to_use}..."
+            "🎨 Activating Nano Banana generation with temp: %s...", temp_to_use
         )
-        prompts_data = self._load_prompts_from_file(context)
+        prompts_data = await self._load_prompts(context)
         if not prompts_data:
             self.logger.warning("⚠️ No prompts found for image generation. Aborting.")
             return context
-        tasks = [
-            self._generate_and_save_image(
-                prompt=prompt_text,
-                garment_name=garment_name,
-                context=context,
-                prompt_type=p_type,
-                client=client,
-                temperature=temp_to_use,  # Pass the final temp
+        # Identical prompts (e.g. mood boards built from a shared template) are
+        # generated once and the image is copied to every target that needs it.
+        targets_by_prompt, skipped = group_prompt_targets(prompts_data)
+        for garment_name, p_type in skipped:
+            self.logger.warning(
+                "⚠️ No prompt text found for '%s' on '%s'. Skipping.",
+                p_type,
+                garment_name,
             )
-            for garment_name, prompts in prompts_data.items()
-            for p_type, prompt_text in prompts.items()
-            if prompt_text
-        ]
-        if not tasks:
+        if not targets_by_prompt:
             self.logger.warning("⚠️ No valid image generation tasks created. Aborting.")
             return context
+        if not self._results_dir_is_writable(context):
+            return context
         self.logger.info(
-            f"🚀 Launching {len(tasks)} image generation tasks in parallel..."
+            "🚀 Launching %d image generation tasks in parallel...",
+            len(targets_by_prompt),
+        )
+        # The config is identical for every image in the run, so build it once.
+        generation_config = types.GenerateContentConfig(
+            response_modalities=["TEXT", "IMAGE"],
+            safety_settings=_SAFETY_SETTINGS,
+            temperature=temp_to_use,
+        )
+        force_regenerate = force_regenerate or settings.FORCE_IMAGE_REGENERATION
+        # Coroutines are created lazily as workers free up, so only the
+        # in-flight requests are ever materialized.
+        results = await gather_bounded(
+            (
+                self._generate_and_save_image(
+                    cleaned_prompt=cleaned_prompt,
+                    targets=targets,
+                    context=context,
+                    client=client,
+                    temperature=temp_to_use,  # Pass the final temp
+                    generation_config=generation_config,
+                    force_regenerate=force_regenerate,
+                )
+                for cleaned_prompt, targets in targets_by_prompt.items()
+            ),
+            settings.IMAGE_GENERATION_MAX_CONCURRENCY,
+            return_exceptions=True,
+        )
+        # Tasks only report what they saved; the report is updated here in one
+        # pass, so no task mutates shared state while others are running.
+        # Pieces are indexed once so each update is a dict lookup.
+        pieces_by_name: Dict[str, Dict[str, Any]] = {}
+        for piece in context.final_report.get("detailed_key_pieces", []):
+            pieces_by_name.setdefault(piece.get("key_piece_name"), piece)
+        context.failed_image_targets = []
+        for targets, result in zip(targets_by_prompt.values(), results):
+            if not isinstance(result, list):
+                context.failed_image_targets.extend(targets)
+                continue
+            for (garment_name, p_type), image_path in zip(targets, result):
+                self._inject_relative_path(
+                    pieces_by_name, context, garment_name, p_type, image_path
+                )
+        await asyncio.to_thread(self._prune_cache)
+        total_targets = sum(len(targets) for targets in targets_by_prompt.values())
+        self.logger.info(
+            "✅ Nano Banana image generation complete: %d succeeded, %d failed.",
+            total_targets - len(context.failed_image_targets),
+            len(context.failed_image_targets),
         )
-        await asyncio.gather(*tasks)
-        self.logger.info("✅ Nano Banana (Gemini) image generation complete.")
         return context
 
     async def _generate_and_save_image(
         self,
-        prompt: str,
-        garment_name: str,
+        cleaned_prompt: str,
+        targets: Sequence[Tuple[str, str]],
         context: RunContext,
-        prompt_type: str,
         client,
         temperature: float,
-    ):
-        """Generates a single image using prompt modification for seed and a specific temperature."""
-        cleaned_prompt = " ".join(
-            re.sub(r"\*\*.*?\*\*|^- ", "", prompt, flags=re.MULTILINE)
-            .replace("\n", " ")
-            .split()
+        generation_config: types.GenerateContentConfig,
+        force_regenerate: bool = False,
+    ) -> Optional[List[Path]]:
+        """
+        Generates a single image using prompt modification for seed and a specific
+        temperature, and saves it for every (garment_name, prompt_type) target
+        that shares the prompt. With `force_regenerate`, the image cache is
+        ignored and the API is always called. Returns the saved
+        paths in target order, or None if the image could not be generated.
+        """
+        garment_name, prompt_type = targets[0]
+        started = time.perf_counter()
+
+        # The output paths do not depend on the attempt, so resolve them up front.
+        temp_suffix = f"-t{int(temperature*10)}"
+        image_paths = [
+            self._image_path(context, target_garment, target_type, temp_suffix)
+            for target_garment, target_type in targets
+        ]
+
+        # Mood boards are only viewed as references, so they are stored at a
+        # reduced size. A prompt shared with a final garment keeps full size.
+        max_edge = (
+            settings.MOODBOARD_MAX_EDGE
+            if all(target_type == "mood_board" for _, target_type in targets)
+            else None
         )
 
-        for attempt in range(settings.MODEL_RETRY_ATTEMPTS):
+        cache_key = _image_cache_key(
+            cleaned_prompt, temperature, context.variation_seed
+        )
+        cache_path = self._cache_dir / f"{cache_key}.png"
+        # A forced run still refreshes the cache with its new image below.
+        cached_bytes = (
+            None
+            if force_regenerate
+            else await asyncio.to_thread(self._read_cached_image, cache_path)
+        )
+        if cached_bytes is not None:
+            await self._save_to_targets(cached_bytes, image_paths, max_edge)
             self.logger.info(
-                f"Generating image for: '{garment_name}' ({prompt_type}) [Temp: {temperature}] - Attempt {attempt + 1}/{settings.MODEL_RETRY_ATTEMPTS}..."
+                "♻️ '%s' (%s) restored from the image cache.",
+                garment_name,
+                prompt_type,
             )
-            try:
-                safety_settings = [
-                    types.SafetySetting(
-                        category=cat, threshold=HarmBlockThreshold.BLOCK_NONE
+            return image_paths
+
+        max_attempts = settings.IMAGE_GENERATION_MAX_RETRIES + 1
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(max_attempts),
+            wait=_wait_for_retry,
+            retry=retry_if_exception(_is_retryable),
+            before_sleep=lambda retry_state: self.logger.warning(
+                "⚠️ Gemini image attempt %d/%d for '%s' failed: %s",
+                retry_state.attempt_number,
+                max_attempts,
+                garment_name,
+                retry_state.outcome.exception(),
+            ),
+            reraise=True,
+        )
+        try:
+            async for attempt in retrying:
+                with attempt:
+                    self.logger.debug(
+                        "Generating image for: '%s' (%s) [Temp: %s] - Attempt %d/%d...",
+                        garment_name,
+                        prompt_type,
+                        temperature,
+                        attempt.retry_state.attempt_number,
+                        max_attempts,
                     )
-                    for cat in [
-                        HarmCategory.HARM_CATEGORY_HARASSMENT,
-                        HarmCategory.HARM_CATEGORY_HATE_SPEECH,
-                        HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
-                        HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
-                    ]
-                ]
-                generation_config = types.GenerateContentConfig(
-                    response_modalities=["TEXT", "IMAGE"],
-                    safety_settings=safety_settings,
-                    temperature=temperature,
-                )
+                    await self._rate_limiter.acquire()
+                    # --- START: IMAGE MODEL REFACTOR ---
+                    # Use the model name from the central settings file.
+                    response = await client.aio.models.generate_content(
+                        model=settings.IMAGE_GENERATION_MODEL_NAME,
+                        contents=[cleaned_prompt],
+                        config=generation_config,
+                    )
+                    # --- END: IMAGE MODEL REFACTOR ---
 
-                # --- START: IMAGE MODEL REFACTOR ---
-                # Use the model name from the central settings file.
-                response = await client.aio.models.generate_content(
-                    model=settings.IMAGE_GENERATION_MODEL_NAME,
-                    contents=[cleaned_prompt],
-                    config=generation_config,
-                )
-                # --- END: IMAGE MODEL REFACTOR ---
-
-                if (
-                    response.candidates
-                    and response.candidates[0].content
-                    and response.candidates[0].content.parts
-                ):
-                    for part in response.candidates[0].content.parts:
-                        if part.inline_data and part.inline_data.data:
-                            image_bytes = part.inline_data.data
-                            image = Image.open(io.BytesIO(image_bytes))
-                            slug = "".join(
-                                c
-                                for c in garment_name.lower()
-                                if c.isalnum() or c in " -"
-                            ).replace(" ", "-")
-
-                            suffix = f"-t{int(temperature*10)}"
-
-                            image_filename = (
-                                f"{slug}-moodboard{suffix}.png"
-                                if prompt_type == "mood_board"
-                                else f"{slug}{suffix}.png"
-                            )
-                            image_path = Path(context.results_dir) / image_filename
-                            image.save(image_path, "PNG")
-                            self.logger.info(
-                                f"✅ Successfully saved image to '{image_path}'"
-                            )
-
-                            relative_path = (
-                                f"results/{context.results_dir.name}/{image_path.name}"
-                            )
-                            for piece in context.final_report.get(
-                                "detailed_key_pieces", []
-                            ):
-                                if piece.get("key_piece_name") == garment_name:
-                                    path_key = (
-                                        "mood_board_relative_path"
-                                        if prompt_type == "mood_board"
-                                        else "final_garment_relative_path"
-                                    )
-                                    piece[path_key] = relative_path
-                                    self.logger.info(
-                                        f"✅ Injected relative path '{relative_path}' into report."
-                                    )
-                                    break
-                            return
-
-                self.logger.warning(
-                    f"⚠️ Gemini API call for '{garment_name}' returned no image data on attempt {attempt + 1}."
-                )
-            except Exception as e:
-                self.logger.error(
-                    f"❌ Gemini API call failed for '{garment_name}' on attempt {attempt + 1}: {e}",
-                    exc_info=(attempt == settings.MODEL_RETRY_ATTEMPTS - 1),
-                )
+                    image_bytes = _extract_image_bytes(response)
+                    if image_bytes is None:
+                        raise _EmptyImageResponse(
+                            f"Gemini returned no image data for '{garment_name}'."
+                        )
+                    await self._save_to_targets(image_bytes, image_paths, max_edge)
+                    await asyncio.to_thread(
+                        self._store_cached_image, image_bytes, cache_path
+                    )
+                    self.logger.info(
+                        "✅ '%s' (%s) saved to %d file(s) in %.1fs",
+                        garment_name,
+                        prompt_type,
+                        len(image_paths),
+                        time.perf_counter() - started,
+                    )
+                    return image_paths
+        except Exception as e:
+            self.logger.error(
+                "❌ Failed to generate an image for '%s': %s",
+                garment_name,
+                e,
+                exc_info=not isinstance(e, _EmptyImageResponse),
+            )
+        return None
 
-            if attempt < settings.MODEL_RETRY_ATTEMPTS - 1:
-                await asyncio.sleep(settings.RETRY_BACKOFF_BASE_DELAY)
+    async def _save_to_targets(
+        self,
+        image_bytes: bytes,
+        image_paths: Sequence[Path],
+        max_edge: Optional[int] = None,
+    ):
+        """
+        Encodes the image once and writes it to every target. Each write is
+        atomic, so a crash or cancellation never leaves a truncated image.
+        """
+        png_bytes = await asyncio.to_thread(_encode_png, image_bytes, max_edge)
+        for image_path in image_paths:
+            await asyncio.to_thread(write_atomic, png_bytes, image_path)
+            self.logger.debug("Saved image to '%s'", image_path)
 
-        self.logger.error(
-            f"❌ All {settings.MODEL_RETRY_ATTEMPTS} attempts to generate an image for '{garment_name}' failed."
-        )
+    def _read_cached_image(self, cache_path: Path) -> Optional[bytes]:
+        """Returns a previously generated image, or None on a cache miss."""
+        if not settings.IMAGE_CACHE_MAX_MB:
+            return None
+        try:
+            image_bytes = cache_path.read_bytes()
+            # Marks the entry as recently used for the LRU prune.
+            cache_path.touch()
+            return image_bytes
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self.logger.warning(
+                "⚠️ Could not read cached image '%s': %s", cache_path, e
+            )
+            return None
 
-    def _load_prompts_from_file(self, context: RunContext) -> dict:
+    def _store_cached_image(self, image_bytes: bytes, cache_path: Path):
+        """Caches a generated image; a failure here never fails the generation."""
+        if not settings.IMAGE_CACHE_MAX_MB:
+            return
         try:
-            prompts_path = Path(context.results_dir) / settings.PROMPTS_FILENAME
-            if prompts_path.exists():
-                with open(prompts_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            else:
-                self.logger.warning(f"⚠️ Prompts file not found at {prompts_path}.")
-                return {}
-        except Exception:
-            self.logger.error(
-                "❌ Could not load or parse prompts from file.", exc_info=True
+            write_atomic(image_bytes, cache_path)
+        except OSError as e:
+            self.logger.warning("⚠️ Could not cache image at '%s': %s", cache_path, e)
+
+    def _prune_cache(self):
+        """Keeps the image cache under IMAGE_CACHE_MAX_MB; never fails the run."""
+        if not settings.IMAGE_CACHE_MAX_MB:
+            return
+        try:
+            _prune_image_cache(self._cache_dir, settings.IMAGE_CACHE_MAX_MB * 1024**2)
+        except OSError as e:
+            self.logger.warning(
+                "⚠️ Could not prune the image cache at '%s': %s", self._cache_dir, e
             )
-            return {}
+
+    def _inject_relative_path(
+        self,
+        pieces_by_name: Dict[str, Dict[str, Any]],
+        context: RunContext,
+        garment_name: str,
+        prompt_type: str,
+        image_path: Path,
+    ):
+        """Records a saved image's public relative path on its report piece."""
+        piece = pieces_by_name.get(garment_name)
+        if piece is None:
+            return
+        relative_path = f"results/{context.results_dir.name}/{image_path.name}"
+        path_key = (
+            "mood_board_relative_path"
+            if prompt_type == "mood_board"
+            else "final_garment_relative_path"
+        )
+        piece[path_key] = relative_path
+        self.logger.debug("Injected relative path '%s' into report.", relative_path)
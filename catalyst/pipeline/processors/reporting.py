@@ -1,7 +1,9 @@
 # catalyst/pipeline/processors/reporting.py
 
-import json
+import asyncio
 from pathlib import Path
+
+import orjson
 from pydantic import ValidationError
 
 from ...context import RunContext
@@ -64,10 +66,12 @@ class FinalValidationProcessor(BaseProcessor):
         try:
             validated_report = FashionTrendReport.model_validate(report_data)
             context.final_report = validated_report.model_dump(mode="json")
+            context.validated_report = validated_report
             self.logger.info("✅ Success: Final report has been validated.")
         except ValidationError as e:
             self.logger.critical(
-                f"❌ CRITICAL: The final assembled report failed Pydantic validation: {e}"
+                "❌ CRITICAL: The final assembled report failed Pydantic validation: %s",
+                e,
             )
             raise RuntimeError(
                 "The final assembled report failed Pydantic validation."
@@ -86,19 +90,26 @@ class FinalOutputGeneratorProcessor(BaseProcessor):
     ensure the output directory exists before writing files.
     """
 
-    def _save_json_file(self, data: dict, filename: str, context: RunContext):
-        """A helper function to save a dictionary to a JSON file."""
+    def _save_json_file(
+        self, data: dict, filename: str, context: RunContext, compact: bool = False
+    ):
+        """
+        A helper function to save a dictionary to a JSON file. `compact` drops
+        the indentation for files that are only read back by code.
+        """
         try:
             output_path = context.results_dir / filename
-            self.logger.info(f"💾 Saving data to '{output_path}'...")
+            self.logger.info("💾 Saving data to '%s'...", output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-            self.logger.info(f"✅ Successfully saved file: {filename}")
+            # orjson serializes straight to UTF-8 bytes, skipping the text
+            # layer and stdlib json's per-object Python overhead.
+            option = None if compact else orjson.OPT_INDENT_2
+            output_path.write_bytes(orjson.dumps(data, option=option))
+            self.logger.info("✅ Successfully saved file: %s", filename)
 
         except (IOError, TypeError) as e:
             self.logger.error(
-                f"❌ Failed to save JSON file '{filename}'", exc_info=True
+                "❌ Failed to save JSON file '%s'", filename, exc_info=True
             )
 
     async def process(self, context: RunContext) -> RunContext:
@@ -116,14 +127,21 @@ class FinalOutputGeneratorProcessor(BaseProcessor):
             final_dir.mkdir(parents=True, exist_ok=True)
         except OSError as e:
             self.logger.critical(
-                f"❌ Could not create output directory {context.results_dir}: {e}",
+                "❌ Could not create output directory %s: %s",
+                context.results_dir,
+                e,
                 exc_info=True,
             )
             raise
 
+        saves = []
         try:
-            # The report is already validated, so we just load it into the model
-            validated_report = FashionTrendReport.model_validate(context.final_report)
+            # Reuse the model from the validation step; the dict is only
+            # validated again when this processor runs on its own.
+            validated_report = (
+                context.validated_report
+                or FashionTrendReport.model_validate(context.final_report)
+            )
             self.logger.info(
                 "🎨 Report data loaded. Initializing prompt generation strategy..."
             )
@@ -153,10 +171,15 @@ class FinalOutputGeneratorProcessor(BaseProcessor):
                     piece["final_garment_prompt"] = piece_prompts.get("final_garment")
             self.logger.info("✅ Successfully injected prompts.")
 
-            self._save_json_file(
-                data=prompts_data,
-                filename=settings.PROMPTS_FILENAME,
-                context=context,
+            context.prompts_data = prompts_data
+            saves.append(
+                asyncio.to_thread(
+                    self._save_json_file,
+                    data=prompts_data,
+                    filename=settings.PROMPTS_FILENAME,
+                    context=context,
+                    compact=True,
+                )
             )
         except Exception:
             self.logger.error(
@@ -164,11 +187,17 @@ class FinalOutputGeneratorProcessor(BaseProcessor):
                 exc_info=True,
             )
 
-        self._save_json_file(
-            data=context.final_report,
-            filename=settings.TREND_REPORT_FILENAME,
-            context=context,
+        saves.append(
+            asyncio.to_thread(
+                self._save_json_file,
+                data=context.final_report,
+                filename=settings.TREND_REPORT_FILENAME,
+                context=context,
+            )
         )
+        # Both files are written in worker threads at the same time, so the
+        # event loop is never blocked on serialization or disk I/O.
+        await asyncio.gather(*saves)
 
         self.logger.info("✅ Success: All reporting outputs have been generated.")
         return context
@@ -101,11 +101,11 @@ class KeyGarmentsProcessor(BaseProcessor):
         designed_garments = []
 
         strategy = context.enriched_brief.get("generation_strategy", "collection")
-        self.logger.info(f"Executing garment generation with strategy: '{strategy}'")
+        self.logger.info("Executing garment generation with strategy: '%s'", strategy)
 
         if strategy == "variations":
             for i in range(3):
-                self.logger.info(f"Designing variation #{i+1} of 3...")
+                self.logger.info("Designing variation #%d of 3...", i + 1)
                 current_history = copy.deepcopy(designed_garments)
                 # FIX: Use the explicit keyword argument
                 garment_data = await garment_builder.build(
@@ -116,12 +116,12 @@ class KeyGarmentsProcessor(BaseProcessor):
                 if garment_data and "key_piece" in garment_data:
                     designed_garments.append(garment_data["key_piece"])
                 else:
-                    self.logger.error(f"❌ Failed to generate variation #{i+1}.")
+                    self.logger.error("❌ Failed to generate variation #%d.", i + 1)
 
         elif strategy == "specified_items":
             garments_to_design = context.enriched_brief.get("explicit_garments", [])
             for garment_name in garments_to_design:
-                self.logger.info(f"Designing specified garment: '{garment_name}'...")
+                self.logger.info("Designing specified garment: '%s'...", garment_name)
                 current_history = copy.deepcopy(designed_garments)
                 # FIX: Use the explicit keyword argument
                 garment_data = await garment_builder.build(
@@ -133,12 +133,12 @@ class KeyGarmentsProcessor(BaseProcessor):
                     designed_garments.append(garment_data["key_piece"])
                 else:
                     self.logger.error(
-                        f"❌ Failed to generate specified garment: '{garment_name}'."
+                        "❌ Failed to generate specified garment: '%s'.", garment_name
                     )
 
         else:  # Default "collection" strategy
             for i in range(3):
-                self.logger.info(f"Designing collection piece #{i+1} of 3...")
+                self.logger.info("Designing collection piece #%d of 3...", i + 1)
                 current_history = copy.deepcopy(designed_garments)
                 # FIX: Use the explicit keyword argument
                 garment_data = await garment_builder.build(
@@ -149,7 +149,7 @@ class KeyGarmentsProcessor(BaseProcessor):
                 if garment_data and "key_piece" in garment_data:
                     designed_garments.append(garment_data["key_piece"])
                 else:
-                    self.logger.error(f"❌ Failed to generate collection piece #{i+1}.")
+                    self.logger.error("❌ Failed to generate collection piece #%d.", i + 1)
 
         context.final_report["detailed_key_pieces"] = designed_garments
         return context
@@ -3,7 +3,7 @@
 import json
 import random
 from typing import Dict, Any, List, Tuple
-from itertools import cycle
+from itertools import cycle, islice
 
 from pydantic import BaseModel, Field
 
@@ -179,19 +179,43 @@ class PromptGenerator:
             [driver.name for driver in self.report.cultural_drivers]
             or ["modern minimalist art"]
         )
+        # Accessories are shuffled once and dealt out in turn, so consecutive
+        # pieces get different pairings instead of independent (and often
+        # repeated) random picks.
+        accessory_names = [item.name for item in self.report.accessories]
+        random.shuffle(accessory_names)
+        accessories_per_piece = min(len(accessory_names), 2)
+        accessory_cycle = cycle(accessory_names)
         desired_mood_list = (
             ", ".join(self.report.desired_mood) or "sophisticated, elegant"
         )
+        # Template arguments that only depend on the report and art direction
+        # are resolved once here; each piece adds only its own fields.
+        mood_board_context = {
+            "overarching_theme": self.report.overarching_theme,
+            "desired_mood_list": desired_mood_list,
+            "narrative_setting": cleaned_narrative_setting,  # Use cleaned variable
+            "antagonist_synthesis": self.report.antagonist_synthesis
+            or "a surprising detail",
+            "target_gender": self.report.target_gender,
+            "target_model_ethnicity": self.report.target_model_ethnicity,
+        }
+        final_garment_context = {
+            "photographic_style": art_direction_model.photographic_style,
+            "lighting_style": art_direction_model.lighting_style,
+            "film_aesthetic": art_direction_model.film_aesthetic,
+            "negative_style_keywords": art_direction_model.negative_style_keywords,
+            "narrative_setting_description": cleaned_narrative_setting,
+            "target_gender": self.report.target_gender,
+            "target_model_ethnicity": self.report.target_model_ethnicity,
+        }
 
         for piece in self.report.detailed_key_pieces:
             current_muse = next(muse_cycle)
             current_inspiration = next(inspiration_cycle)
 
-            all_accessory_names = [item.name for item in self.report.accessories]
             sampled_accessories = (
-                ", ".join(
-                    random.sample(all_accessory_names, min(len(all_accessory_names), 2))
-                )
+                ", ".join(islice(accessory_cycle, accessories_per_piece))
                 or "a statement handbag"
             )
             color_names = ", ".join(filter(None, [c.name for c in piece.colors]))
@@ -212,13 +236,9 @@ class PromptGenerator:
 
             piece_prompts = {
                 "mood_board": prompt_library.MOOD_BOARD_PROMPT_TEMPLATE.format(
-                    overarching_theme=self.report.overarching_theme,
-                    desired_mood_list=desired_mood_list,
+                    **mood_board_context,
                     influential_model_name=current_muse,
-                    narrative_setting=cleaned_narrative_setting,  # Use cleaned variable
                     core_concept_inspiration=current_inspiration,
-                    antagonist_synthesis=self.report.antagonist_synthesis
-                    or "a surprising detail",
                     key_piece_name=piece.key_piece_name,
                     formatted_fabric_details=self._format_visual_fabric_details(
                         piece.fabrics
@@ -229,15 +249,9 @@ class PromptGenerator:
                     ),
                     details_trims=", ".join(piece.details_trims[:3]),
                     key_accessories=sampled_accessories,
-                    target_gender=self.report.target_gender,
-                    target_model_ethnicity=self.report.target_model_ethnicity,
                 ),
                 "final_garment": prompt_library.FINAL_GARMENT_PROMPT_TEMPLATE.format(
-                    photographic_style=art_direction_model.photographic_style,
-                    lighting_style=art_direction_model.lighting_style,
-                    film_aesthetic=art_direction_model.film_aesthetic,
-                    negative_style_keywords=art_direction_model.negative_style_keywords,
-                    narrative_setting_description=cleaned_narrative_setting,  # Use cleaned variable
+                    **final_garment_context,
                     key_piece_name=piece.key_piece_name,
                     garment_description_with_synthesis=piece.description,
                     visual_color_palette=self._get_visual_color_palette(piece),
@@ -252,8 +266,6 @@ class PromptGenerator:
                     ),
                     styling_description=" and ".join(piece.suggested_pairings[:2])
                     or "authentic styling",
-                    target_gender=self.report.target_gender,
-                    target_model_ethnicity=self.report.target_model_ethnicity,
                 ),
             }
             all_prompts[piece.key_piece_name or "untitled"] = piece_prompts
@@ -5,3 +5,4 @@ Exports the core components of the resilience package.
 """
 from .invoker import invoke_with_resilience
 from .exceptions import ResilienceError, MaxRetriesExceededError
+from .rate_limiter import AsyncRateLimiter
@@ -8,6 +8,7 @@ of receiving a valid, structured response.
 """
 
 import json
+import re
 from typing import (
     Callable,
     Awaitable,
@@ -19,6 +20,8 @@ from typing import (
     get_args,
     Union,
 )
+
+import orjson
 from pydantic import BaseModel, ValidationError
 
 from .exceptions import MaxRetriesExceededError
@@ -29,8 +32,21 @@ from .. import settings
 PydanticModel = TypeVar("PydanticModel", bound=BaseModel)
 logger = get_logger(__name__)
 
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+
 
 # --- START: THE DEFINITIVE SANITIZATION PIPELINE ---
+def _repair_json_text(text: str) -> str:
+    """
+    Applies cheap, local fixes for the most common ways an AI emits almost-valid
+    JSON (markdown code fences and trailing commas). This lets us recover
+    without paying for a second round-trip to the model.
+    """
+    if text.startswith("```"):
+        text = text.strip("`").removeprefix("json")
+    return _TRAILING_COMMA_RE.sub(r"\1", text).strip()
+
+
 def _sanitize_ai_response(data: Any) -> Any:
     """
     Recursively finds and fixes stringified JSON lists/objects within a data structure.
@@ -130,7 +146,16 @@ async def invoke_with_resilience(
             raise ValueError("AI call returned an empty or malformed response object.")
 
         raw_text = response_data["text"].strip()
-        parsed_json = json.loads(raw_text)
+        # orjson parses in C; the sanitization pipeline always runs afterwards,
+        # because a stringified list can still pass strict validation against
+        # a `str` field and would otherwise reach callers as a raw string.
+        try:
+            parsed_json = orjson.loads(raw_text)
+        except orjson.JSONDecodeError:
+            logger.warning(
+                "⚠️ AI response was not valid JSON. Attempting local repair."
+            )
+            parsed_json = orjson.loads(_repair_json_text(raw_text))
 
         sanitized_json = _sanitize_ai_response(parsed_json)
         final_data = _normalize_lists_recursively(sanitized_json, response_schema)
@@ -0,0 +1,56 @@
+# catalyst/resilience/rate_limiter.py
+
+"""
+An asyncio token-bucket rate limiter for pacing calls to quota-limited APIs.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+
+class AsyncRateLimiter:
+    """
+    Spaces out calls to a sustained requests-per-minute rate. Each caller
+    awaits `acquire()` before its request; tokens refill continuously and up
+    to `capacity` of them may be spent in a burst. Waiters are served in
+    arrival order. `clock` and `sleep` can be replaced to drive the limiter
+    from a fake clock in tests.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        capacity: float = 1.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        if requests_per_minute <= 0:
+            raise ValueError(
+                f"requests_per_minute must be positive, got {requests_per_minute}."
+            )
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}.")
+        self.rate_per_second = requests_per_minute / 60.0
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._last_refill = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Waits until a token is available, then consumes it."""
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._last_refill) * self.rate_per_second,
+                )
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await self._sleep((1 - self._tokens) / self.rate_per_second)
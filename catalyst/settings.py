@@ -21,11 +21,13 @@ LOGS_DIR = BASE_DIR / "logs"
 RESULTS_DIR = BASE_DIR / "results"
 CHROMA_PERSIST_DIR = BASE_DIR / "chroma_cache"
 ARTIFACT_CACHE_DIR = BASE_DIR / "artifact_cache"
+IMAGE_CACHE_DIR = BASE_DIR / "image_cache"
 
 LOGS_DIR.mkdir(parents=True, exist_ok=True)
 RESULTS_DIR.mkdir(parents=True, exist_ok=True)
 CHROMA_PERSIST_DIR.mkdir(parents=True, exist_ok=True)
 ARTIFACT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+IMAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 
 # --- 2. API Keys & Secrets ---
@@ -42,6 +44,9 @@ GEMINI_MODEL_NAME = "gemini-2.5-flash"
 GEMINI_PRO_MODEL_NAME = "gemini-2.5-pro"
 IMAGE_GENERATION_MODEL_NAME = "gemini-2.5-flash-image"
 GEMINI_DEFAULT_TIMEOUT_SECONDS = 60
+# Connection pre-warming is best-effort, so its probes give up quickly rather
+# than holding up worker startup on a slow or unreachable upstream.
+PREWARM_TIMEOUT_SECONDS = 5
 
 
 # --- 4. Unified Resilience & Retry Configuration ---
@@ -52,6 +57,23 @@ MODEL_RETRY_ATTEMPTS = 3
 # The base delay (in seconds) for the exponential backoff calculation between retries.
 RETRY_BACKOFF_BASE_DELAY = 5
 
+# The maximum number of image generation requests allowed in flight at once.
+# Firing every request together trips provider rate limits, and the resulting
+# 429 backoff makes the whole batch slower than a bounded fan-out.
+IMAGE_GENERATION_MAX_CONCURRENCY = 4
+
+# How many times a single image request is retried on a transient error
+# (429/5xx). Image models have tight per-minute quotas, so this is higher
+# than MODEL_RETRY_ATTEMPTS; losing an image forces a full pipeline re-run.
+IMAGE_GENERATION_MAX_RETRIES = 5
+
+# The sustained request rate allowed against the Gemini image model. Requests
+# are paced to this rate so a finished batch of concurrent calls does not
+# immediately re-fire into the per-minute quota. Lower it for preview tiers.
+GEMINI_IMAGE_RPM = int(os.getenv("GEMINI_IMAGE_RPM", "60"))
+if GEMINI_IMAGE_RPM <= 0:
+    raise ValueError("CRITICAL ERROR: GEMINI_IMAGE_RPM must be a positive integer.")
+
 
 # --- 5. Caching Configuration ---
 EMBEDDING_MODEL_NAME = "gemini-embedding-001"
@@ -60,12 +82,27 @@ CACHE_DISTANCE_THRESHOLD = 0.10
 CHROMA_SERVER_HOST = os.getenv("CHROMA_SERVER_HOST", "localhost")
 CHROMA_SERVER_PORT = int(os.getenv("CHROMA_SERVER_PORT", "8000"))
 
+# Upper bound, in megabytes, on the Gemini image cache in IMAGE_CACHE_DIR.
+# After each run the least recently used images are deleted until the cache
+# fits again. Set to 0 to disable the image cache entirely.
+IMAGE_CACHE_MAX_MB = int(os.getenv("IMAGE_CACHE_MAX_MB", "1024"))
+if IMAGE_CACHE_MAX_MB < 0:
+    raise ValueError("CRITICAL ERROR: IMAGE_CACHE_MAX_MB must not be negative.")
+
 
 # --- 6. File & Logging Configuration ---
 LOG_FILE_PATH = LOGS_DIR / "catalyst_engine.log"
 TREND_REPORT_FILENAME = "itemized_fashion_trends.json"
 PROMPTS_FILENAME = "generated_prompts.json"
 
+# zlib level (0-9) used when an image has to be re-encoded to PNG. Generated
+# images gain little from heavier compression, so favour encode speed.
+IMAGE_PNG_COMPRESS_LEVEL = 1
+
+# Longest edge, in pixels, that mood-board images are stored at. Larger
+# images are downscaled before saving; final garment images are untouched.
+MOODBOARD_MAX_EDGE = 1024
+
 
 # --- 7. Results Management ---
 KEEP_N_RESULTS = 3
@@ -74,3 +111,7 @@ KEEP_N_RESULTS = 3
 # --- 8. Feature Flags ---
 ENABLE_IMAGE_GENERATION = os.getenv("ENABLE_IMAGE_GENERATION", "True").lower() == "true"
 IMAGE_GENERATION_MODEL = os.getenv("IMAGE_GENERATION_MODEL", "nano-banana")
+# Images in the image cache are reused for identical requests unless this is set.
+FORCE_IMAGE_REGENERATION = (
+    os.getenv("FORCE_IMAGE_REGENERATION", "False").lower() == "true"
+)
@@ -65,6 +65,7 @@ def clear_file_caches():
     dirs_to_clear = [
         settings.CHROMA_PERSIST_DIR,
         settings.ARTIFACT_CACHE_DIR,
+        settings.IMAGE_CACHE_DIR,
         settings.RESULTS_DIR,
     ]
     print("This will permanently delete the following directories:")
@@ -89,6 +90,7 @@ def clear_file_caches():
     settings.RESULTS_DIR.mkdir(exist_ok=True)
     settings.ARTIFACT_CACHE_DIR.mkdir(exist_ok=True)
     settings.CHROMA_PERSIST_DIR.mkdir(exist_ok=True)
+    settings.IMAGE_CACHE_DIR.mkdir(exist_ok=True)
     print("✅ File cache clearing complete.")
 
 
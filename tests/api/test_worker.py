@@ -140,5 +140,7 @@ class TestRegenerateImagesTask:
         call_kwargs = mock_image_generator.process.call_args.kwargs
         assert "seed_override" not in call_kwargs
         assert call_kwargs["temperature_override"] == temp
+        # The prompts are unchanged, so only a forced run yields new images.
+        assert call_kwargs["force_regenerate"] is True
 
     # --- END: THE DEFINITIVE TEST FIX ---
@@ -0,0 +1,33 @@
+# tests/api/test_worker_settings.py
+
+import asyncio
+
+import pytest
+
+from api import worker_settings
+from catalyst import settings
+
+
+@pytest.mark.asyncio
+class TestOnStartup:
+    """Tests the ARQ worker's startup hook."""
+
+    async def test_hanging_prewarm_does_not_block_startup(self, mocker):
+        """Verify a pre-warm that never returns is abandoned after its timeout."""
+        openai_prewarm_started = False
+
+        async def hang():
+            await asyncio.Event().wait()
+
+        async def openai_prewarm():
+            nonlocal openai_prewarm_started
+            openai_prewarm_started = True
+
+        mocker.patch.object(worker_settings, "SENTRY_DSN", None)
+        mocker.patch.object(settings, "PREWARM_TIMEOUT_SECONDS", 0.01)
+        mocker.patch.object(worker_settings.gemini, "prewarm_async", hang)
+        mocker.patch.object(worker_settings, "prewarm_openai_client", openai_prewarm)
+
+        await asyncio.wait_for(worker_settings.on_startup({}), timeout=1)
+
+        assert openai_prewarm_started
@@ -4,6 +4,7 @@ import pytest
 from pydantic import BaseModel
 from google.api_core import exceptions as google_exceptions
 
+from catalyst.clients import gemini
 from catalyst.clients.gemini.core import generate_content_core_async
 from catalyst.clients.gemini.schema import process_response_schema
 from catalyst import settings  # Import settings for the retry count
@@ -77,3 +78,26 @@ class TestGeminiCore:
         # and once for the fallback model (which also fails).
         assert mock_generate_content.call_count == 2
         # --- END: THE DEFINITIVE FIX ---
+
+
+@pytest.mark.asyncio
+class TestGeminiPrewarm:
+    async def test_prewarm_async_fetches_model_metadata(self, mocker):
+        """Verify that pre-warming issues a single cheap request on the shared client."""
+        mock_get = mocker.patch(
+            "catalyst.clients.gemini.client.aio.models.get",
+            new_callable=mocker.AsyncMock,
+        )
+
+        await gemini.prewarm_async()
+
+        mock_get.assert_awaited_once_with(model=settings.GEMINI_MODEL_NAME)
+
+    async def test_prewarm_async_swallows_errors(self, mocker):
+        """Verify that a failed pre-warm never prevents the worker from starting."""
+        mocker.patch(
+            "catalyst.clients.gemini.client.aio.models.get",
+            side_effect=google_exceptions.ServiceUnavailable("Service is down"),
+        )
+
+        await gemini.prewarm_async()
@@ -1,9 +1,16 @@
 # tests/catalyst/clients/gemini/test_resilience.py
 
+import httpx
 import pytest
 from google.api_core import exceptions as google_exceptions
+from google.genai import errors as genai_errors
 
-from catalyst.clients.gemini.resilience import should_retry, calculate_backoff_delay
+from catalyst.clients.gemini.resilience import (
+    should_retry,
+    calculate_backoff_delay,
+    calculate_full_jitter_delay,
+    get_retry_after_delay,
+)
 from catalyst import settings  # Import settings to use the new base delay
 
 
@@ -13,6 +20,8 @@ class TestGeminiResilience:
         [
             google_exceptions.ServiceUnavailable("Service is down"),
             google_exceptions.TooManyRequests("Rate limit exceeded"),
+            genai_errors.ClientError(429, {"error": {"status": "RESOURCE_EXHAUSTED"}}),
+            genai_errors.ServerError(503, {"error": {"status": "UNAVAILABLE"}}),
         ],
     )
     def test_should_retry_on_retryable_errors(self, exception):
@@ -22,6 +31,7 @@ class TestGeminiResilience:
         "exception",
         [
             google_exceptions.BadRequest("Invalid request"),
+            genai_errors.ClientError(400, {"error": {"status": "INVALID_ARGUMENT"}}),
             ValueError("A content-level error"),
         ],
     )
@@ -42,3 +52,40 @@ class TestGeminiResilience:
         assert (base * 2 + 0.5) <= delay2 <= (base * 2 + 1.5)
         assert (base * 4 + 0.5) <= delay3 <= (base * 4 + 1.5)
         # --- END: THE DEFINITIVE FIX ---
+
+    def test_calculate_full_jitter_delay_spans_whole_window(self, mocker):
+        """Verify the delay is drawn from zero up to the capped exponential delay."""
+        uniform = mocker.patch("random.uniform", return_value=1.0)
+        base = settings.RETRY_BACKOFF_BASE_DELAY
+
+        assert calculate_full_jitter_delay(1) == 1.0
+        uniform.assert_called_with(0, base * 2)
+        calculate_full_jitter_delay(20)
+        uniform.assert_called_with(0, 60)
+
+    def test_get_retry_after_delay_reads_header(self):
+        """Verify the Retry-After header is honoured when present."""
+        response = httpx.Response(429, headers={"retry-after": "12"})
+        error = genai_errors.ClientError(429, {}, response)
+        assert get_retry_after_delay(error) == 12.0
+
+    def test_get_retry_after_delay_reads_retry_info(self):
+        """Verify Gemini's RetryInfo error detail is used when there is no header."""
+        error_body = {
+            "error": {
+                "code": 429,
+                "status": "RESOURCE_EXHAUSTED",
+                "details": [
+                    {"@type": "type.googleapis.com/google.rpc.QuotaFailure"},
+                    {
+                        "@type": "type.googleapis.com/google.rpc.RetryInfo",
+                        "retryDelay": "30s",
+                    },
+                ],
+            }
+        }
+        error = genai_errors.ClientError(429, error_body)
+        assert get_retry_after_delay(error) == 30.0
+
+    def test_get_retry_after_delay_returns_none_without_hint(self):
+        assert get_retry_after_delay(ValueError("boom")) is None
@@ -0,0 +1,255 @@
+# tests/catalyst/pipeline/processors/generation/test_base_generator.py
+
+import asyncio
+import inspect
+import json
+from pathlib import Path
+
+import pytest
+
+from catalyst import settings
+from catalyst.context import RunContext
+from catalyst.pipeline.processors.generation import (
+    DalleImageGeneration,
+    GptImage1Generation,
+    NanoBananaGeneration,
+)
+from catalyst.pipeline.processors.generation.base_generator import (
+    BaseImageGenerator,
+    copy_atomic,
+    decode_and_write_image,
+    gather_bounded,
+    group_prompt_targets,
+    slugify,
+    write_atomic,
+)
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_limits_in_flight_tasks():
+    """Verifies results keep their order and no more than `limit` run at once."""
+    in_flight = 0
+    peak = 0
+
+    async def work(value: int) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return value
+
+    results = await gather_bounded([work(i) for i in range(10)], limit=3)
+
+    assert results == list(range(10))
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_consumes_generators_lazily():
+    """Verifies coroutines are only created as worker slots free up."""
+    created = finished = peak_pending = 0
+
+    async def work(value: int) -> int:
+        nonlocal finished
+        await asyncio.sleep(0)
+        finished += 1
+        return value
+
+    def jobs():
+        nonlocal created, peak_pending
+        for i in range(10):
+            created += 1
+            peak_pending = max(peak_pending, created - finished)
+            yield work(i)
+
+    results = await gather_bounded(jobs(), limit=2)
+
+    assert results == list(range(10))
+    assert peak_pending <= 2
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_cancels_remaining_work_on_failure():
+    """Verifies a failure stops the other workers from starting new jobs."""
+    started = []
+    cancelled = []
+
+    async def work(value: int) -> int:
+        started.append(value)
+        if value == 0:
+            raise ValueError("boom")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(value)
+            raise
+        return value
+
+    with pytest.raises(ValueError, match="boom"):
+        await gather_bounded((work(i) for i in range(10)), limit=2)
+
+    assert started == [0, 1]
+    assert cancelled == [1]
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+@pytest.mark.asyncio
+async def test_gather_bounded_rejects_non_positive_limit(limit):
+    with pytest.raises(ValueError, match="at least 1"):
+        await gather_bounded([], limit=limit)
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_can_return_exceptions():
+    """Verifies a failing awaitable does not abort the batch when requested."""
+
+    async def work(value: int) -> int:
+        if value == 1:
+            raise ValueError("boom")
+        return value
+
+    results = await gather_bounded(
+        (work(i) for i in range(3)), limit=2, return_exceptions=True
+    )
+
+    assert results[0] == 0 and results[2] == 2
+    assert isinstance(results[1], ValueError)
+
+
+@pytest.mark.parametrize(
+    "garment_name, expected",
+    [
+        ("Test Jacket", "test-jacket"),
+        ("Trench Coat (Oversized)!", "trench-coat-oversized"),
+        ("A-Line  Skirt", "a-line--skirt"),
+        ("Crêpe Blouse", "crêpe-blouse"),
+    ],
+)
+def test_slugify(garment_name: str, expected: str):
+    """Verifies the ASCII fast path and the Unicode fallback agree on the rules."""
+    assert slugify(garment_name) == expected
+
+
+def test_write_atomic_replaces_existing_file(tmp_path: Path):
+    """Verifies the target ends up with the new bytes and no temp file remains."""
+    target = tmp_path / "image.png"
+    target.write_bytes(b"old")
+
+    write_atomic(b"new", target)
+
+    assert target.read_bytes() == b"new"
+    assert [p.name for p in tmp_path.iterdir()] == ["image.png"]
+
+
+def test_write_atomic_leaves_nothing_behind_on_failure(tmp_path: Path, mocker):
+    """Verifies a failed write neither creates the target nor leaks a temp file."""
+    mocker.patch(
+        "catalyst.pipeline.processors.generation.base_generator.os.replace",
+        side_effect=OSError("disk full"),
+    )
+
+    with pytest.raises(OSError):
+        write_atomic(b"data", tmp_path / "image.png")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_copy_atomic_copies_without_leaving_temp_files(tmp_path: Path):
+    """Verifies the copy lands at the destination with nothing else left behind."""
+    source = tmp_path / "source.png"
+    source.write_bytes(b"image")
+
+    copy_atomic(source, tmp_path / "copy.png")
+
+    assert (tmp_path / "copy.png").read_bytes() == b"image"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["copy.png", "source.png"]
+
+
+def test_decode_and_write_image_leaves_nothing_behind_on_failure(
+    tmp_path: Path, mocker
+):
+    """Verifies a failed GPT-Image-1 write leaves no truncated image."""
+    mocker.patch(
+        "catalyst.pipeline.processors.generation.base_generator.os.replace",
+        side_effect=OSError("disk full"),
+    )
+
+    with pytest.raises(OSError):
+        decode_and_write_image("aW1hZ2U=", tmp_path / "image.png")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_group_prompt_targets_merges_identical_prompts():
+    """Verifies identical cleaned prompts share one entry and empty ones are skipped."""
+    prompts_data = {
+        "Coat": {"final_garment": "**Style:** a wool coat", "mood_board": ""},
+        "Jacket": {"final_garment": "a  wool coat", "mood_board": "a mood board"},
+    }
+
+    targets_by_prompt, skipped = group_prompt_targets(prompts_data)
+
+    assert targets_by_prompt == {
+        "a wool coat": [("Coat", "final_garment"), ("Jacket", "final_garment")],
+        "a mood board": [("Jacket", "mood_board")],
+    }
+    assert skipped == [("Coat", "mood_board")]
+
+
+def test_group_prompt_targets_skips_prompts_empty_after_cleaning():
+    """Verifies prompts that clean down to nothing never become targets."""
+    prompts_data = {"Coat": {"final_garment": "  \n** **\n", "mood_board": "a coat"}}
+
+    targets_by_prompt, skipped = group_prompt_targets(prompts_data)
+
+    assert targets_by_prompt == {"a coat": [("Coat", "mood_board")]}
+    assert skipped == [("Coat", "final_garment")]
+
+
+class _StubGenerator(BaseImageGenerator):
+    async def process(
+        self, context, *, temperature_override=None, force_regenerate=False
+    ):
+        return context
+
+
+def _process_parameters(generator_class) -> list:
+    return [
+        (p.name, p.kind, p.default)
+        for p in inspect.signature(generator_class.process).parameters.values()
+    ]
+
+
+@pytest.mark.parametrize(
+    "generator_class",
+    [_StubGenerator, DalleImageGeneration, GptImage1Generation, NanoBananaGeneration],
+)
+def test_process_signature_matches_base_class(generator_class):
+    """Verify every generator, and the test stub, accepts the base `process` contract."""
+    assert _process_parameters(generator_class) == _process_parameters(
+        BaseImageGenerator
+    )
+
+
+@pytest.mark.asyncio
+async def test_load_prompts_reads_file_once_and_caches(tmp_path: Path):
+    """Verify the shared loader parses the prompts file and caches it on the context."""
+    context = RunContext(user_passage="test", results_dir=tmp_path)
+    context.results_dir.mkdir(parents=True)
+    prompts_data = {"Coat": {"final_garment": "a coat"}}
+    prompts_path = context.results_dir / settings.PROMPTS_FILENAME
+    prompts_path.write_text(json.dumps(prompts_data))
+    generator = _StubGenerator()
+
+    assert await generator._load_prompts(context) == prompts_data
+    prompts_path.unlink()
+    assert await generator._load_prompts(context) == prompts_data
+
+
+@pytest.mark.asyncio
+async def test_load_prompts_returns_empty_dict_without_file(tmp_path: Path):
+    context = RunContext(user_passage="test", results_dir=tmp_path)
+
+    assert await _StubGenerator()._load_prompts(context) == {}
+    assert context.prompts_data is None
@@ -0,0 +1,110 @@
+# tests/catalyst/pipeline/processors/generation/test_dalle3_generator.py
+
+import json
+from functools import partial
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from catalyst import settings
+from catalyst.context import RunContext
+from catalyst.pipeline.processors.generation import dalle3_generator
+from catalyst.pipeline.processors.generation.dalle3_generator import (
+    DalleImageGeneration,
+)
+
+IMAGE_URL = "https://images.example.com/generated.png"
+IMAGE_BYTES = b"\x89PNG\r\n\x1a\nfake-image-data"
+
+
+@pytest.fixture
+def run_context(tmp_path: Path) -> RunContext:
+    """Provides a RunContext with two garments that share an identical prompt."""
+    context = RunContext(user_passage="test", results_dir=tmp_path)
+    context.final_report = {
+        "detailed_key_pieces": [
+            {"key_piece_name": "Test Jacket"},
+            {"key_piece_name": "Test Coat"},
+        ]
+    }
+    prompts_data = {
+        "Test Jacket": {"final_garment": "a shared prompt"},
+        "Test Coat": {"final_garment": "a  shared prompt"},
+    }
+    context.results_dir.mkdir(parents=True)
+    with open(context.results_dir / settings.PROMPTS_FILENAME, "w") as f:
+        json.dump(prompts_data, f)
+    return context
+
+
+@pytest.fixture
+def mock_client(mocker) -> MagicMock:
+    """Creates a mock OpenAI client that returns a hosted image URL."""
+    mock_response = mocker.Mock(data=[mocker.Mock(url=IMAGE_URL)])
+    client = MagicMock()
+    client.images.generate = AsyncMock(return_value=mock_response)
+    return client
+
+
+def _serve_image(request: httpx.Request, status_code: int = 200) -> httpx.Response:
+    """Serves IMAGE_BYTES for IMAGE_URL with the given status code."""
+    assert str(request.url) == IMAGE_URL
+    return httpx.Response(status_code, content=IMAGE_BYTES)
+
+
+def _http_client(status_code: int = 200) -> httpx.AsyncClient:
+    """Builds an httpx client whose transport is handled by `_serve_image`."""
+    return httpx.AsyncClient(
+        transport=httpx.MockTransport(partial(_serve_image, status_code=status_code))
+    )
+
+
+@pytest.mark.asyncio
+class TestDalleImageGeneration:
+    """Tests the DALL-E 3 generator through the shared `process` interface."""
+
+    async def test_process_downloads_image_to_every_target(
+        self, run_context, mock_client
+    ):
+        """Verify the hosted image is downloaded once and saved for each garment."""
+        async with _http_client() as http_client:
+            generator = DalleImageGeneration(
+                client=mock_client, http_client=http_client
+            )
+            await generator.process(run_context)
+
+        mock_client.images.generate.assert_called_once()
+        for filename in ("test-jacket.png", "test-coat.png"):
+            assert (run_context.results_dir / filename).read_bytes() == IMAGE_BYTES
+
+    async def test_failed_download_leaves_no_file(self, run_context, mock_client):
+        """Verify an HTTP error writes neither an image nor a temp file."""
+        async with _http_client(status_code=500) as http_client:
+            generator = DalleImageGeneration(
+                client=mock_client, http_client=http_client
+            )
+            await generator.process(run_context)
+
+        assert list(run_context.results_dir.glob("*.png")) == []
+        assert list(run_context.results_dir.glob("*.tmp")) == []
+
+    async def test_standalone_generator_closes_its_download_client(
+        self, run_context, mock_client, mocker
+    ):
+        """Verify a generator without an injected pool leaves no client open."""
+        opened = []
+        real_client_class = httpx.AsyncClient
+
+        def make_client(**kwargs) -> httpx.AsyncClient:
+            client = real_client_class(transport=httpx.MockTransport(_serve_image))
+            opened.append(client)
+            return client
+
+        mocker.patch.object(dalle3_generator.httpx, "AsyncClient", make_client)
+        generator = DalleImageGeneration(client=mock_client)
+        await generator.process(run_context)
+
+        assert (run_context.results_dir / "test-jacket.png").read_bytes() == IMAGE_BYTES
+        assert opened and all(client.is_closed for client in opened)
@@ -0,0 +1,64 @@
+# tests/catalyst/pipeline/processors/generation/test_factory.py
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from catalyst import settings
+from catalyst.pipeline.processors import generation
+
+
+@pytest.mark.asyncio
+class TestPrewarmOpenAIClient:
+    async def test_prewarm_fetches_model_metadata(self, mocker):
+        """Verify that pre-warming issues one cheap request on the shared client."""
+        mocker.patch.object(settings, "IMAGE_GENERATION_MODEL", "dall-e-3")
+        mock_client = MagicMock()
+        probe_client = mock_client.with_options.return_value
+        probe_client.models.retrieve = AsyncMock()
+        mocker.patch.object(
+            generation,
+            "_get_shared_openai_clients",
+            return_value=(mock_client, MagicMock()),
+        )
+
+        await generation.prewarm_openai_client()
+
+        mock_client.with_options.assert_called_once_with(
+            max_retries=0, timeout=settings.PREWARM_TIMEOUT_SECONDS
+        )
+        probe_client.models.retrieve.assert_awaited_once_with("dall-e-3")
+
+    async def test_prewarm_skips_non_openai_models(self, mocker):
+        """Verify that no OpenAI client is built when Nano Banana is configured."""
+        mocker.patch.object(settings, "IMAGE_GENERATION_MODEL", "nano-banana")
+        spy = mocker.patch.object(generation, "_get_shared_openai_clients")
+
+        await generation.prewarm_openai_client()
+
+        spy.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestCloseOpenAIClient:
+    async def test_close_releases_shared_pool(self, mocker):
+        """Verify shutdown closes the shared pool and the next call builds a new one."""
+        mocker.patch.object(generation, "_shared_http_client", None)
+        mocker.patch.object(generation, "_shared_openai_client", None)
+        _, http_client = generation._get_shared_openai_clients()
+
+        await generation.close_openai_client()
+
+        assert http_client.is_closed
+        _, new_http_client = generation._get_shared_openai_clients()
+        assert new_http_client is not http_client
+        await generation.close_openai_client()
+
+    async def test_close_without_open_pool_is_a_no_op(self, mocker):
+        """Verify shutdown succeeds when no OpenAI generator ever ran."""
+        mocker.patch.object(generation, "_shared_http_client", None)
+        mocker.patch.object(generation, "_shared_openai_client", None)
+
+        await generation.close_openai_client()
+
+        assert generation._shared_http_client is None
@@ -0,0 +1,65 @@
+# tests/catalyst/pipeline/processors/generation/test_gpt_image1_generator.py
+
+import base64
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from catalyst import settings
+from catalyst.context import RunContext
+from catalyst.pipeline.processors.generation.gpt_image1_generator import (
+    GptImage1Generation,
+)
+
+ONE_PIXEL_PNG_B64 = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+
+
+@pytest.fixture
+def run_context(tmp_path: Path) -> RunContext:
+    """Provides a RunContext with two garments that share an identical prompt."""
+    context = RunContext(user_passage="test", results_dir=tmp_path)
+    context.final_report = {
+        "detailed_key_pieces": [
+            {"key_piece_name": "Test Jacket"},
+            {"key_piece_name": "Test Coat"},
+        ]
+    }
+    prompts_data = {
+        "Test Jacket": {"final_garment": "a shared prompt"},
+        "Test Coat": {"final_garment": "a  shared prompt", "mood_board": ""},
+    }
+    context.results_dir.mkdir(parents=True)
+    with open(context.results_dir / settings.PROMPTS_FILENAME, "w") as f:
+        json.dump(prompts_data, f)
+    return context
+
+
+@pytest.fixture
+def mock_client(mocker) -> MagicMock:
+    """Creates a mock OpenAI client that returns a one-pixel PNG."""
+    mock_response = mocker.Mock(data=[mocker.Mock(b64_json=ONE_PIXEL_PNG_B64)])
+    client = MagicMock()
+    client.images.generate = AsyncMock(return_value=mock_response)
+    return client
+
+
+@pytest.mark.asyncio
+class TestGptImage1Generation:
+    """Tests the GPT-Image-1 generator through the shared `process` interface."""
+
+    async def test_process_generates_identical_prompts_once(
+        self, run_context, mock_client
+    ):
+        """Verify duplicate prompts cost one API call but still produce every file."""
+        generator = GptImage1Generation(client=mock_client)
+        await generator.process(run_context, temperature_override=1.0)
+
+        mock_client.images.generate.assert_called_once()
+        assert mock_client.images.generate.call_args.kwargs["prompt"] == (
+            "a shared prompt"
+        )
+        expected_bytes = base64.b64decode(ONE_PIXEL_PNG_B64)
+        for filename in ("test-jacket.png", "test-coat.png"):
+            assert (run_context.results_dir / filename).read_bytes() == expected_bytes
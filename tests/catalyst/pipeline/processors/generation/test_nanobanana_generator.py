@@ -3,10 +3,18 @@
 import pytest
 import json
 import base64
+import io
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock, call, ANY
 
+import httpx
+from google.genai import errors as genai_errors
+from PIL import Image
+
+from catalyst.clients.gemini.resilience import MAX_RETRY_DELAY_SECONDS
 from catalyst.context import RunContext
+from catalyst.resilience import AsyncRateLimiter
 from catalyst.pipeline.processors.generation.nanobanana_generator import (
     NanoBananaGeneration,
 )
@@ -16,6 +24,21 @@ from catalyst.pipeline.processors.generation import (
 )
 
 
+@pytest.fixture(autouse=True)
+def image_cache_dir(tmp_path: Path, mocker) -> Path:
+    """Points the image cache at a per-test directory so runs never share images."""
+    cache_dir = tmp_path / "image_cache"
+    cache_dir.mkdir()
+    mocker.patch.object(settings, "IMAGE_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def fresh_shared_rate_limiter(mocker):
+    """Gives each test its own process-wide limiter instead of one shared across tests."""
+    mocker.patch.object(generator_module, "_shared_rate_limiter", None)
+
+
 @pytest.fixture
 def run_context(tmp_path: Path) -> RunContext:
     """Provides a fresh RunContext pointing to a temporary results directory."""
@@ -64,6 +87,44 @@ class TestNanoBananaGenerationDI:
         mock_client.aio.models.generate_content.assert_called_once()
         assert (run_context.results_dir / "test-jacket-t7.png").exists()
 
+    async def test_process_writes_png_bytes_without_reencoding(
+        self, run_context, prompts_file, mock_client, mocker
+    ):
+        """Verify PNG responses are written verbatim without going through Pillow."""
+        spy = mocker.spy(generator_module.Image, "open")
+        generator = NanoBananaGeneration(client=mock_client)
+        await generator.process(run_context)
+
+        spy.assert_not_called()
+        response = mock_client.aio.models.generate_content.return_value
+        expected_bytes = response.candidates[0].content.parts[0].inline_data.data
+        saved_path = run_context.results_dir / "test-jacket-t7.png"
+        assert saved_path.read_bytes() == expected_bytes
+
+    async def test_process_injects_relative_path_into_report(
+        self, run_context, prompts_file, mock_client
+    ):
+        """Verify the saved image's path is written back onto the matching piece."""
+        generator = NanoBananaGeneration(client=mock_client)
+        await generator.process(run_context)
+
+        piece = run_context.final_report["detailed_key_pieces"][0]
+        assert piece["final_garment_relative_path"] == (
+            f"results/{run_context.results_dir.name}/test-jacket-t7.png"
+        )
+
+    async def test_process_reuses_prompts_cached_on_context(
+        self, run_context, mock_client
+    ):
+        """Verify cached prompts are used without the prompts file existing."""
+        run_context.results_dir.mkdir(parents=True)
+        run_context.prompts_data = {"Test Jacket": {"final_garment": "a test prompt"}}
+        generator = NanoBananaGeneration(client=mock_client)
+        await generator.process(run_context)
+
+        mock_client.aio.models.generate_content.assert_called_once()
+        assert not (run_context.results_dir / settings.PROMPTS_FILENAME).exists()
+
     # --- START: THE DEFINITIVE TEST FIX ---
     async def test_process_with_temp_override(
         self, run_context, prompts_file, mock_client
@@ -89,6 +150,13 @@ class TestNanoBananaGenerationDI:
 
     # --- END: THE DEFINITIVE TEST FIX ---
 
+    async def test_instances_share_one_rate_limiter(self, mock_client):
+        """Verify concurrent jobs draw from a single quota bucket."""
+        first = NanoBananaGeneration(client=mock_client)
+        second = NanoBananaGeneration(client=mock_client)
+
+        assert first._rate_limiter is second._rate_limiter
+
     async def test_process_does_not_create_real_client_if_injected(
         self, run_context, prompts_file, mock_client, mocker
     ):
@@ -98,6 +166,177 @@ class TestNanoBananaGenerationDI:
         await generator.process(run_context)
         spy.assert_not_called()
 
+    async def test_process_reuses_shared_gemini_client(
+        self, run_context, prompts_file, mock_client, mocker
+    ):
+        """Verify the process-wide Gemini client is reused instead of building a new one."""
+        mocker.patch.object(generator_module.client_instance, "client", mock_client)
+        spy = mocker.spy(generator_module.genai, "Client")
+        generator = NanoBananaGeneration()
+        await generator.process(run_context)
+
+        spy.assert_not_called()
+        mock_client.aio.models.generate_content.assert_called_once()
+
+    async def test_process_aborts_before_calling_api_if_results_dir_unwritable(
+        self, run_context, prompts_file, mock_client, mocker
+    ):
+        """Verify an unwritable results directory is caught before any request."""
+        mocker.patch.object(Path, "touch", side_effect=PermissionError("read-only"))
+        generator = NanoBananaGeneration(client=mock_client)
+        await generator.process(run_context)
+
+        mock_client.aio.models.generate_content.assert_not_called()
+
+    async def test_process_populates_image_cache(
+        self, run_context, prompts_file, mock_client, image_cache_dir
+    ):
+        """Verify a generated image is stored in the cache for later runs."""
+        generator = NanoBananaGeneration(client=mock_client)
+        await generator.process(run_context)
+
+        saved_bytes = (run_context.results_dir / "test-jacket-t7.png").read_bytes()
+        assert [p.read_bytes() for p in image_cache_dir.iterdir()] == [saved_bytes]
+
+    async def test_process_reuses_cached_image_without_api_call(
+        self, run_context, prompts_file, mock_client, image_cache_dir
+    ):
+        """Verify a cache hit is copied to the target and skips the API."""
+        cache_key = generator_module._image_cache_key("a test prompt", 0.7)
+        cached_path = image_cache_dir / f"{cache_key}.png"
+        Image.new("RGB", (2, 2)).save(cached_path, "PNG")
+        generator = NanoBananaGeneration(client=mock_client)
+        await generator.process(run_context)
+
+        mock_client.aio.models.generate_content.assert_not_called()
+        saved_path = run_context.results_dir / "test-jacket-t7.png"
+        assert saved_path.read_bytes() == cached_path.read_bytes()
+
+    async def test_regeneration_bypasses_image_cache(
+        self, run_context, prompts_file, mock_client, image_cache_dir
+    ):
+        """Verify a forced regeneration calls the API despite a cache hit."""
+        cache_key = generator_module._image_cache_key("a test prompt", 0.7)
+        cached_path = image_cache_dir / f"{cache_key}.png"
+        Image.new("RGB", (2, 2)).save(cached_path, "PNG")
+        generator = NanoBananaGeneration(client=mock_client)
+        await generator.process(
+            run_context, temperature_override=0.7, force_regenerate=True
+        )
+
+        mock_client.aio.models.generate_content.assert_called_once()
+        saved_bytes = (run_context.results_dir / "test-jacket-t7.png").read_bytes()
+        assert cached_path.read_bytes() == saved_bytes
+
+    async def test_force_regeneration_setting_bypasses_image_cache(
+        self, run_context, prompts_file, mock_client, image_cache_dir, mocker
+    ):
+        """Verify FORCE_IMAGE_REGENERATION ignores the image cache."""
+        mocker.patch.object(settings, "FORCE_IMAGE_REGENERATION", True)
+        cache_key = generator_module._image_cache_key("a test prompt", 0.7)
+        Image.new("RGB", (2, 2)).save(image_cache_dir / f"{cache_key}.png", "PNG")
+        generator = NanoBananaGeneration(client=mock_client)
+        await generator.process(run_context)
+
+        mock_client.aio.models.generate_content.assert_called_once()
+
+    async def test_variation_seed_misses_cache_of_other_seeds(
+        self, run_context, prompts_file, mock_client, image_cache_dir
+    ):
+        """Verify a variation run with unchanged prompts still generates new images."""
+        for seed in (0, 1):
+            run_context.variation_seed = seed
+            await NanoBananaGeneration(client=mock_client).process(run_context)
+
+        assert mock_client.aio.models.generate_content.call_count == 2
+        assert len(list(image_cache_dir.iterdir())) == 2
+
+    async def test_disabled_image_cache_is_neither_read_nor_written(
+        self, run_context, prompts_file, mock_client, image_cache_dir, mocker
+    ):
+        """Verify IMAGE_CACHE_MAX_MB=0 turns the image cache off."""
+        mocker.patch.object(settings, "IMAGE_CACHE_MAX_MB", 0)
+        cache_key = generator_module._image_cache_key("a test prompt", 0.7)
+        Image.new("RGB", (2, 2)).save(image_cache_dir / f"{cache_key}.png", "PNG")
+        generator = NanoBananaGeneration(client=mock_client)
+        await generator.process(run_context)
+
+        mock_client.aio.models.generate_content.assert_called_once()
+        saved_bytes = (run_context.results_dir / "test-jacket-t7.png").read_bytes()
+        cached_bytes = (image_cache_dir / f"{cache_key}.png").read_bytes()
+        assert cached_bytes != saved_bytes
+
+    async def test_failed_save_leaves_no_partial_file(
+        self, run_context, prompts_file, mock_client, mocker
+    ):
+        """Verify a failed write leaves neither a truncated image nor a temp file."""
+        mocker.patch(
+            "catalyst.pipeline.processors.generation.base_generator.os.replace",
+            side_effect=OSError("disk full"),
+        )
+        generator = NanoBananaGeneration(client=mock_client)
+        await generator.process(run_context)
+
+        assert list(run_context.results_dir.glob("*.png")) == []
+        assert list(run_context.results_dir.glob("*.tmp")) == []
+
+    async def test_process_generates_identical_prompts_once(
+        self, run_context, mock_client
+    ):
+        """Verify duplicate prompts cost one API call but every target gets its file."""
+        run_context.results_dir.mkdir(parents=True)
+        run_context.final_report["detailed_key_pieces"].append(
+            {"key_piece_name": "Test Coat"}
+        )
+        run_context.prompts_data = {
+            "Test Jacket": {"mood_board": "a shared mood board"},
+            "Test Coat": {"mood_board": "a shared mood board"},
+        }
+        generator = NanoBananaGeneration(client=mock_client)
+        await generator.process(run_context)
+
+        mock_client.aio.models.generate_content.assert_called_once()
+        for slug, piece in zip(
+            ("test-jacket", "test-coat"),
+            run_context.final_report["detailed_key_pieces"],
+        ):
+            filename = f"{slug}-moodboard-t7.png"
+            assert (run_context.results_dir / filename).exists()
+            assert piece["mood_board_relative_path"].endswith(filename)
+
+    async def test_process_records_failed_targets(
+        self, run_context, prompts_file, mock_client, mocker
+    ):
+        """Verify images that fail every attempt are recorded on the context."""
+        mocker.patch.object(
+            generator_module, "calculate_full_jitter_delay", return_value=0
+        )
+        mock_client.aio.models.generate_content.side_effect = genai_errors.ServerError(
+            503, {"error": {"status": "UNAVAILABLE"}}
+        )
+        unlimited = AsyncRateLimiter(requests_per_minute=60_000, capacity=100)
+        generator = NanoBananaGeneration(client=mock_client, rate_limiter=unlimited)
+        await generator.process(run_context)
+
+        assert (
+            mock_client.aio.models.generate_content.call_count
+            == settings.IMAGE_GENERATION_MAX_RETRIES + 1
+        )
+        assert run_context.failed_image_targets == [("Test Jacket", "final_garment")]
+
+    async def test_process_does_not_retry_permanent_errors(
+        self, run_context, prompts_file, mock_client
+    ):
+        """Verify a non-transient API error fails the image after a single call."""
+        mock_client.aio.models.generate_content.side_effect = genai_errors.ClientError(
+            400, {"error": {"status": "INVALID_ARGUMENT"}}
+        )
+        generator = NanoBananaGeneration(client=mock_client)
+        await generator.process(run_context)
+
+        mock_client.aio.models.generate_content.assert_called_once()
+        assert run_context.failed_image_targets == [("Test Jacket", "final_garment")]
+
     async def test_process_handles_no_api_key_gracefully(self, run_context, mocker):
         """Verify that the generator disables itself if no API key is present."""
         mocker.patch.object(settings, "GEMINI_API_KEY", None)
@@ -105,3 +344,84 @@ class TestNanoBananaGenerationDI:
         generator = NanoBananaGeneration()
         await generator.process(run_context)
         spy.assert_not_called()
+
+
+class TestPruneImageCache:
+    def test_deletes_least_recently_used_images_first(self, image_cache_dir: Path):
+        """Verify the oldest entries go first and the cache ends within the bound."""
+        for age, name in enumerate(["newest", "middle", "oldest"]):
+            path = image_cache_dir / f"{name}.png"
+            path.write_bytes(b"x" * 10)
+            os.utime(path, (1_000_000 - age, 1_000_000 - age))
+
+        generator_module._prune_image_cache(image_cache_dir, max_bytes=20)
+
+        assert sorted(p.stem for p in image_cache_dir.iterdir()) == ["middle", "newest"]
+
+    def test_leaves_cache_within_bound_untouched(self, image_cache_dir: Path):
+        (image_cache_dir / "only.png").write_bytes(b"x" * 10)
+
+        generator_module._prune_image_cache(image_cache_dir, max_bytes=10)
+
+        assert (image_cache_dir / "only.png").exists()
+
+
+class TestWaitForRetry:
+    @staticmethod
+    def _retry_state(mocker, retry_after: str):
+        response = httpx.Response(429, headers={"retry-after": retry_after})
+        error = genai_errors.ClientError(429, {}, response)
+        retry_state = mocker.Mock(attempt_number=1)
+        retry_state.outcome.exception.return_value = error
+        return retry_state
+
+    def test_caps_server_retry_after(self, mocker):
+        """Verify an oversized Retry-After is capped at the backoff ceiling."""
+        retry_state = self._retry_state(mocker, "3600")
+
+        assert generator_module._wait_for_retry(retry_state) == (
+            MAX_RETRY_DELAY_SECONDS
+        )
+
+    def test_honours_zero_retry_after(self, mocker):
+        """Verify a Retry-After of 0 is honoured instead of falling back to jitter."""
+        jitter = mocker.patch.object(generator_module, "calculate_full_jitter_delay")
+
+        assert generator_module._wait_for_retry(self._retry_state(mocker, "0")) == 0
+        jitter.assert_not_called()
+
+
+class TestExtractImageBytes:
+    def test_skips_text_parts(self, mocker):
+        """Verify the first inline image is found after any leading text parts."""
+        text_part = mocker.Mock(inline_data=None)
+        image_part = mocker.Mock(inline_data=mocker.Mock(data=b"png-bytes"))
+        content = mocker.Mock(parts=[text_part, image_part])
+        response = mocker.Mock(candidates=[mocker.Mock(content=content)])
+
+        assert generator_module._extract_image_bytes(response) == b"png-bytes"
+
+    def test_returns_none_without_candidates(self, mocker):
+        response = mocker.Mock(candidates=[])
+        assert generator_module._extract_image_bytes(response) is None
+
+
+class TestEncodePng:
+    @staticmethod
+    def _png_bytes(size) -> bytes:
+        buffer = io.BytesIO()
+        Image.new("RGB", size).save(buffer, "PNG")
+        return buffer.getvalue()
+
+    def test_downscales_images_larger_than_max_edge(self):
+        """Verify oversized images are shrunk to fit max_edge, keeping aspect ratio."""
+        encoded = generator_module._encode_png(self._png_bytes((200, 100)), 50)
+
+        with Image.open(io.BytesIO(encoded)) as saved:
+            assert saved.size == (50, 25)
+
+    def test_keeps_small_png_verbatim(self):
+        """Verify images within max_edge are passed through without re-encoding."""
+        image_bytes = self._png_bytes((20, 10))
+
+        assert generator_module._encode_png(image_bytes, 50) is image_bytes
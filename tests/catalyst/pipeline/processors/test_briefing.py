@@ -66,6 +66,22 @@ class TestBriefDeconstructionProcessor:
             await processor.process(run_context)
 
 
+class TestCreateSlug:
+    """Tests for the theme slug helper used to name the results folder."""
+
+    @pytest.mark.parametrize(
+        "text, expected_slug",
+        [
+            (None, "untitled"),
+            ("Quiet Luxury: The New Minimalism!", "quiet-luxury-th"),
+            ("  Neo -- Tokyo\tNights ", "neo-tokyo-night"),
+            ("Café Société", "caf-socit"),
+        ],
+    )
+    def test_create_slug(self, text, expected_slug):
+        assert BriefDeconstructionProcessor()._create_slug(text) == expected_slug
+
+
 # ... (The other test classes in this file remain unchanged) ...
 @pytest.mark.asyncio
 class TestConsolidatedBriefingProcessor:
@@ -78,6 +78,9 @@ class TestFinalOutputGeneratorProcessor:
         prompts_path = context.results_dir / "generated_prompts.json"
         assert report_path.exists()
         assert prompts_path.exists()
+        # The prompts file is machine-read only, so it is written compactly.
+        assert json.loads(prompts_path.read_bytes()) == mock_prompts
+        assert b"\n" not in prompts_path.read_bytes()
 
         # --- CHANGE: Add assertion to check for injected narrative setting ---
         with open(report_path, "r") as f:
@@ -91,6 +94,31 @@ class TestFinalOutputGeneratorProcessor:
             == "final_garment_prompt_jacket"
         )
 
+    async def test_process_reuses_validated_report(
+        self, valid_run_context: RunContext, mocker
+    ):
+        """Verify the model from the validation step is used instead of revalidating."""
+        valid_run_context.validated_report = FashionTrendReport.model_validate(
+            valid_run_context.final_report
+        )
+        future = asyncio.Future()
+        future.set_result(({}, ArtDirectionModel()))
+        mock_prompt_generator_instance = mocker.Mock()
+        mock_prompt_generator_instance.generate_prompts.return_value = future
+        prompt_generator_cls = mocker.patch(
+            "catalyst.pipeline.processors.reporting.PromptGenerator",
+            return_value=mock_prompt_generator_instance,
+        )
+        validate_spy = mocker.spy(FashionTrendReport, "model_validate")
+
+        await FinalOutputGeneratorProcessor().process(valid_run_context)
+
+        validate_spy.assert_not_called()
+        assert (
+            prompt_generator_cls.call_args.kwargs["report"]
+            is valid_run_context.validated_report
+        )
+
     async def test_process_raises_error_on_empty_report(self, tmp_path: Path):
         context = RunContext(user_passage="test", results_dir=tmp_path)
         context.final_report = {}
@@ -99,3 +99,32 @@ class TestStrategicPromptGenerator:
         assert "-   **Photography:** " in final_prompt
         assert "-   **Lighting:** " in final_prompt
         assert "-   **Aesthetic:** " in final_prompt
+
+    async def test_accessories_are_dealt_without_repeats(
+        self, strategic_fashion_report, mock_art_direction_model, mocker
+    ):
+        """
+        Verify accessories are shuffled once and dealt across pieces, so no
+        accessory repeats until every one has been used.
+        """
+        mocker.patch(
+            "catalyst.pipeline.prompt_engineering.prompt_generator.invoke_with_resilience",
+            return_value=mock_art_direction_model,
+        )
+        accessory_names = ["Acc One", "Acc Two", "Acc Three", "Acc Four"]
+        strategic_fashion_report.accessories = [
+            ReportNamedDescription(name=name, description="...")
+            for name in accessory_names
+        ]
+        strategic_fashion_report.detailed_key_pieces = [
+            KeyPieceDetail(key_piece_name="Garment Alpha"),
+            KeyPieceDetail(key_piece_name="Garment Beta"),
+        ]
+        generator = PromptGenerator(
+            report=strategic_fashion_report, research_dossier={}
+        )
+        prompts, _ = await generator.generate_prompts()
+
+        mood_boards = " ".join(p["mood_board"] for p in prompts.values())
+        for name in accessory_names:
+            assert mood_boards.count(name) == 1
@@ -3,10 +3,11 @@
 import json
 import pytest
 from pydantic import BaseModel, Field, ValidationError
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from catalyst.clients import gemini
 from catalyst.resilience.invoker import (
+    _repair_json_text,
     _sanitize_ai_response,
     _normalize_lists_recursively,
     invoke_with_resilience,
@@ -67,6 +68,19 @@ class TestSanitizationPipelineUnit:
         """Test _sanitize_ai_response with various edge cases."""
         assert _sanitize_ai_response(input_data) == expected_output
 
+    @pytest.mark.parametrize(
+        "raw_text, expected_output",
+        [
+            # Trailing commas in objects and lists
+            ('{"a": [1, 2,], "b": 3,}', {"a": [1, 2], "b": 3}),
+            # Markdown code fence around the payload
+            ('```json\n{"a": 1}\n```', {"a": 1}),
+        ],
+    )
+    def test_repair_json_text(self, raw_text, expected_output):
+        """Test that _repair_json_text turns almost-valid JSON into parseable JSON."""
+        assert json.loads(_repair_json_text(raw_text)) == expected_output
+
     @pytest.mark.parametrize(
         "input_data, expected_output",
         [
@@ -158,6 +172,48 @@ class TestInvokeWithResilienceIntegration:
         assert isinstance(result.nested_data.items, list)
         assert result.nested_data.tags == ["tag1", "tag2"]
 
+    async def test_stringified_list_in_str_field_is_still_parsed(self, mocker):
+        """Test that a stringified list is unpacked even when it validates as-is."""
+
+        class BriefModel(BaseModel):
+            garment_type: Union[str, List[str]]
+
+        mock_response = mocker.Mock()
+        mock_response.text = json.dumps({"garment_type": '["dress", "coat"]'})
+        mocker.patch(
+            "catalyst.clients.gemini.core.client.aio.models.generate_content",
+            return_value=mock_response,
+        )
+
+        result = await invoke_with_resilience(
+            ai_function=gemini.generate_content_async,
+            prompt="test prompt",
+            response_schema=BriefModel,
+        )
+        assert result.garment_type == ["dress", "coat"]
+
+    async def test_malformed_json_is_repaired_locally(self, mocker):
+        """Test that a response with trailing commas is repaired without a new API call."""
+        response_text = (
+            '{"report_name": "Repaired Report", '
+            '"nested_data": {"items": [{"name": "item1", "value": 1},],},}'
+        )
+
+        mock_response = mocker.Mock()
+        mock_response.text = response_text
+        mock_generate = mocker.patch(
+            "catalyst.clients.gemini.core.client.aio.models.generate_content",
+            return_value=mock_response,
+        )
+
+        result = await invoke_with_resilience(
+            ai_function=gemini.generate_content_async,
+            prompt="test prompt",
+            response_schema=TopLevelModel,
+        )
+        assert result.report_name == "Repaired Report"
+        mock_generate.assert_called_once()
+
     async def test_failure_path_with_unrecoverable_error(self, mocker):
         """Test that an unfixable response (e.g., missing required field) raises an error."""
         invalid_data = {
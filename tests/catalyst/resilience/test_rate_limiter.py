@@ -0,0 +1,51 @@
+# tests/catalyst/resilience/test_rate_limiter.py
+
+import pytest
+
+from catalyst.resilience.rate_limiter import AsyncRateLimiter
+
+
+class FakeClock:
+    """A controllable monotonic clock whose sleeps advance time instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def make_limiter(clock: FakeClock, **kwargs) -> AsyncRateLimiter:
+    return AsyncRateLimiter(**kwargs, clock=clock.monotonic, sleep=clock.sleep)
+
+
+@pytest.mark.asyncio
+class TestAsyncRateLimiter:
+    async def test_burst_capacity_is_spent_without_waiting(self, clock):
+        limiter = make_limiter(clock, requests_per_minute=60, capacity=3)
+        for _ in range(3):
+            await limiter.acquire()
+        assert clock.sleeps == []
+
+    async def test_requests_beyond_capacity_are_paced_to_the_rate(self, clock):
+        """Verify that once the bucket is empty, each call waits 60/RPM seconds."""
+        limiter = make_limiter(clock, requests_per_minute=30, capacity=1)
+        for _ in range(3):
+            await limiter.acquire()
+        assert clock.sleeps == [pytest.approx(2.0), pytest.approx(2.0)]
+        assert clock.now == pytest.approx(4.0)
+
+    @pytest.mark.parametrize("requests_per_minute", [0, -5])
+    async def test_rejects_non_positive_rate(self, requests_per_minute):
+        with pytest.raises(ValueError, match="must be positive"):
+            AsyncRateLimiter(requests_per_minute=requests_per_minute)